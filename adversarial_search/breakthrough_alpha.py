@@ -1,11 +1,45 @@
-from typing import List
-import copy
+from typing import List, Optional, Tuple
+from functools import lru_cache
+from time import perf_counter
+import random
 
 PLAYER_ONE = "W"
 PLAYER_TWO = "B"
 EMPTY = "."
 
 type Board = List[List[str]]
+type Move = Tuple[int, int]
+
+MAX_SIZE = 8
+MAX_PLY = 2 * MAX_SIZE * MAX_SIZE
+WIN = 1_000_000
+DECIDED = WIN - MAX_PLY
+
+# Evaluation weights, in hundredths of a pawn. ADVANCE is indexed by the
+# number of rows a pawn still has to travel.
+PAWN = 100
+ADVANCE = (0, 60, 30, 16, 8, 4, 2, 0)
+HOME = 10
+DEFENDED = 6
+HANGING = 15
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+_zobrist = random.Random(2024)
+ZOBRIST = [[_zobrist.getrandbits(64) for _ in range(MAX_SIZE * MAX_SIZE)] for _ in range(2)]
+ZOBRIST_SIDE = _zobrist.getrandbits(64)
+
+
+@lru_cache(maxsize=None)
+def piece_square_tables(size: int) -> Tuple[List[int], List[int]]:
+    """Material plus advancement per square, positive for white and
+    negative for black, so a position's score is a plain sum."""
+    white, black = [], []
+    for r in range(size):
+        for c in range(size):
+            white.append(PAWN + ADVANCE[min(r, 7)] + (HOME if r == size - 1 else 0))
+            black.append(-(PAWN + ADVANCE[min(size - 1 - r, 7)] + (HOME if r == 0 else 0)))
+    return white, black
 
 
 def initial_board(size: int = 4) -> Board:
@@ -26,101 +60,464 @@ def get_opponent(player: str) -> str:
     return PLAYER_ONE if player == PLAYER_TWO else PLAYER_TWO
 
 
-def is_terminal(board: Board, player: str) -> bool:
-    size = len(board)
-    opponent = get_opponent(player)
+class Bitboard:
+    """
+    Breakthrough position with one int per side.
+
+    Square (r, c) is bit r * size + c. White (side 0) moves towards row 0,
+    so its pawns advance with a right shift by `size`; black (side 1) moves
+    towards the last row with a left shift. Captures shift by size +/- 1,
+    masking out the edge file a pawn cannot capture from. `key` is the
+    Zobrist hash and `score` the material and advancement balance from
+    white's side; both are updated incrementally by make/unmake.
+    """
+    __slots__ = ("size", "pieces", "side", "history", "key", "score", "tables",
+                 "full", "not_left", "not_right", "goal")
+
+    def __init__(self, size: int, white: int, black: int, side: int = 0):
+        if not 2 <= size <= MAX_SIZE:
+            raise ValueError(f"board size must be between 2 and {MAX_SIZE}")
+        self.size = size
+        self.pieces = [white, black]
+        self.side = side
+        self.history = []
+
+        row = (1 << size) - 1
+        left = sum(1 << (r * size) for r in range(size))
+        self.full = (1 << (size * size)) - 1
+        self.not_left = self.full & ~left
+        self.not_right = self.full & ~(left << (size - 1))
+        self.goal = (row, row << (size * (size - 1)))
+
+        self.tables = piece_square_tables(size)
+        self.key = ZOBRIST_SIDE if side else 0
+        self.score = 0
+        for s, bits in enumerate(self.pieces):
+            while bits:
+                low = bits & -bits
+                square = low.bit_length() - 1
+                self.key ^= ZOBRIST[s][square]
+                self.score += self.tables[s][square]
+                bits ^= low
+
+    @classmethod
+    def from_board(cls, board: Board, player: str = PLAYER_ONE) -> "Bitboard":
+        size = len(board)
+        white = black = 0
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell == PLAYER_ONE:
+                    white |= 1 << (r * size + c)
+                elif cell == PLAYER_TWO:
+                    black |= 1 << (r * size + c)
+        return cls(size, white, black, 0 if player == PLAYER_ONE else 1)
+
+    def to_board(self) -> Board:
+        size = self.size
+        white, black = self.pieces
+        board = []
+        for r in range(size):
+            row = []
+            for c in range(size):
+                bit = 1 << (r * size + c)
+                row.append(PLAYER_ONE if white & bit else PLAYER_TWO if black & bit else EMPTY)
+            board.append(row)
+        return board
+
+    def player(self) -> str:
+        return PLAYER_ONE if self.side == 0 else PLAYER_TWO
+
+    def has_won(self, side: int) -> bool:
+        return bool(self.pieces[side] & self.goal[side]) or not self.pieces[1 - side]
+
+    def utility(self, side: int) -> int:
+        if self.has_won(side):
+            return WIN
+        if self.has_won(1 - side):
+            return -WIN
+        return 0
+
+    def evaluate(self, side: int) -> int:
+        """Heuristic value for `side`: the incremental score plus a term for
+        pawns defended by a neighbour and pawns attacked but undefended."""
+        n = self.size
+        white, black = self.pieces
+        white_attacks = (white & self.not_left) >> (n + 1) | (white & self.not_right) >> (n - 1)
+        black_attacks = (black & self.not_left) << (n - 1) | (black & self.not_right) << (n + 1)
+        score = (self.score
+                 + DEFENDED * ((white & white_attacks).bit_count() - (black & black_attacks).bit_count())
+                 - HANGING * ((white & black_attacks & ~white_attacks).bit_count()
+                              - (black & white_attacks & ~black_attacks).bit_count()))
+        return score if side == 0 else -score
+
+    def moves(self) -> List[Move]:
+        """Legal (from, to) moves for the side to move, captures first."""
+        n = self.size
+        own = self.pieces[self.side]
+        other = self.pieces[1 - self.side]
+        empty = self.full & ~(own | other)
+        moves = []
+        if self.side == 0:
+            _collect((own & self.not_left) >> (n + 1) & other, n + 1, moves)
+            _collect((own & self.not_right) >> (n - 1) & other, n - 1, moves)
+            _collect(own >> n & empty, n, moves)
+        else:
+            _collect((own & self.not_left) << (n - 1) & other, 1 - n, moves)
+            _collect((own & self.not_right) << (n + 1) & other, -1 - n, moves)
+            _collect(own << n & empty, -n, moves)
+        return moves
+
+    def make(self, move: Move):
+        frm, to = move
+        side = self.side
+        bit = 1 << to
+        captured = self.pieces[1 - side] & bit
+        self.history.append((move, captured, self.key, self.score))
+        self.pieces[side] ^= (1 << frm) | bit
+        key = self.key ^ ZOBRIST[side][frm] ^ ZOBRIST[side][to] ^ ZOBRIST_SIDE
+        table = self.tables[side]
+        score = self.score + table[to] - table[frm]
+        if captured:
+            self.pieces[1 - side] ^= bit
+            key ^= ZOBRIST[1 - side][to]
+            score -= self.tables[1 - side][to]
+        self.key = key
+        self.score = score
+        self.side = 1 - side
+
+    def unmake(self):
+        (frm, to), captured, self.key, self.score = self.history.pop()
+        side = self.side = 1 - self.side
+        self.pieces[side] ^= (1 << frm) | (1 << to)
+        if captured:
+            self.pieces[1 - side] |= captured
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of searched positions, indexed by Zobrist key.
+
+    Each slot holds (key, depth, value, bound, move, generation). Values
+    are stored from the point of view of the side to move, so one table can
+    serve both players. A slot is replaced when it is empty, left over from
+    an earlier search, or searched no deeper than the new entry.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        size = 1 << max(size - 1, 1).bit_length()
+        self.mask = size - 1
+        self.slots = [None] * size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def new_search(self):
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[tuple]:
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, value: float, bound: int, move: Optional[Move]):
+        index = key & self.mask
+        entry = self.slots[index]
+        if entry is None or entry[5] != self.generation or depth >= entry[1]:
+            self.slots[index] = (key, depth, value, bound, move, self.generation)
+            self.stores += 1
+
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def __str__(self):
+        return (f"{self.probes} probes, {self.hits} hits ({self.hit_rate():.1%}), "
+                f"{self.cutoffs} cutoffs, {self.stores} stores")
 
-    # Win if a pawn reaches opponent's back row
-    if player == PLAYER_ONE and PLAYER_ONE in board[0]:
-        return True
-    if player == PLAYER_TWO and PLAYER_TWO in board[-1]:
-        return True
 
-    # Win if opponent has no pieces
-    return not any(opponent in row for row in board)
+def _collect(targets: int, delta: int, moves: List[Move]):
+    # delta is the offset from a target square back to the pawn that moves there
+    while targets:
+        low = targets & -targets
+        to = low.bit_length() - 1
+        moves.append((to + delta, to))
+        targets ^= low
+
+
+def is_terminal(board: Board, player: str) -> bool:
+    position = Bitboard.from_board(board)
+    return position.has_won(0 if player == PLAYER_ONE else 1)
 
 
 def utility_of(board: Board, player: str) -> int:
-    if is_terminal(board, player):
-        return 1
-    elif is_terminal(board, get_opponent(player)):
-        return -1
-    return 0
+    position = Bitboard.from_board(board)
+    side = 0 if player == PLAYER_ONE else 1
+    return position.utility(side) or position.evaluate(side)
 
 
 def successors_of(board: Board, player: str) -> List[Board]:
-    size = len(board)
+    position = Bitboard.from_board(board, player)
     successors = []
-    direction = -1 if player == PLAYER_ONE else 1
-
-    for r in range(size):
-        for c in range(size):
-            if board[r][c] != player:
-                continue
-            new_r = r + direction
-
-            if 0 <= new_r < size:
-                # Forward
-                if board[new_r][c] == EMPTY:
-                    new_board = copy.deepcopy(board)
-                    new_board[r][c] = EMPTY
-                    new_board[new_r][c] = player
-                    successors.append(new_board)
-
-                # Diagonal captures
-                for dc in [-1, 1]:
-                    nc = c + dc
-                    if 0 <= nc < size and board[new_r][nc] == get_opponent(player):
-                        new_board = copy.deepcopy(board)
-                        new_board[r][c] = EMPTY
-                        new_board[new_r][nc] = player
-                        successors.append(new_board)
+    for move in position.moves():
+        position.make(move)
+        successors.append(position.to_board())
+        position.unmake()
     return successors
 
 
-def alpha_beta_decision(board: Board, player: str) -> Board:
-    def max_value(state, alpha, beta, depth):
-        if is_terminal(state, player) or depth == 4:
-            return utility_of(state, player)
+def to_table(value: int, ply: int) -> int:
+    # win scores count plies from the root; the table keeps them relative to the node
+    if value >= DECIDED:
+        return value + ply
+    if value <= -DECIDED:
+        return value - ply
+    return value
+
+
+def from_table(value: int, ply: int) -> int:
+    if value >= DECIDED:
+        return value - ply
+    if value <= -DECIDED:
+        return value + ply
+    return value
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class AlphaBetaSearch:
+    """
+    Iterative-deepening alpha-beta over a single Bitboard.
+
+    Each iteration reuses the transposition table from the previous one, so
+    the principal variation is searched first. Other moves are ordered as
+    captures, then killer moves for the ply, then by history score. A search
+    that runs past its deadline is abandoned, and the move from the last
+    finished iteration is kept.
+    """
+
+    def __init__(self, position: Bitboard, table: Optional[TranspositionTable] = None):
+        self.position = position
+        self.table = table if table is not None else TranspositionTable()
+        self.me = position.side
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [[0] * (MAX_SIZE ** 4) for _ in range(2)]
+        self.deadline = None
+        self.nodes = 0
+        self.depth = 0
+        self.best = None
+        self.value = None
+
+    def order(self, moves: List[Move], first: Optional[Move], ply: int) -> List[Move]:
+        other = self.position.pieces[1 - self.position.side]
+        killers = self.killers[ply]
+        history = self.history[self.position.side]
+        squares = MAX_SIZE * MAX_SIZE
+
+        def score(move):
+            if move == first:
+                return 1 << 62
+            if other >> move[1] & 1:
+                return 1 << 61
+            if move in killers:
+                return 1 << 60
+            return history[move[0] * squares + move[1]]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def cutoff(self, move: Move, depth: int, ply: int):
+        # only quiet moves become killers; captures are tried early anyway
+        position = self.position
+        if position.pieces[1 - position.side] >> move[1] & 1:
+            return
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[position.side][move[0] * MAX_SIZE * MAX_SIZE + move[1]] += depth * depth
+
+    def tick(self):
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes & 1023 and perf_counter() > self.deadline:
+            raise SearchTimeout
+
+    def max_value(self, alpha, beta, depth, ply):
+        position, table = self.position, self.table
+        value = position.utility(self.me)
+        if value:
+            return value - ply if value > 0 else value + ply  # prefer quicker wins
+        if depth == 0:
+            return position.evaluate(self.me)
+        self.tick()
+        key = position.key
+        entry = table.probe(key)
+        if entry is not None and entry[1] >= depth:
+            value, bound = from_table(entry[2], ply), entry[3]
+            if bound == EXACT or (bound == LOWER and value >= beta) or (bound == UPPER and value <= alpha):
+                table.cutoffs += 1
+                return value
+        moves = position.moves()
+        if not moves:
+            return ply - WIN  # a blocked side loses
+        alpha0 = alpha
         v = float('-inf')
-        for s in successors_of(state, player):
-            v = max(v, min_value(s, alpha, beta, depth + 1))
+        best = None
+        for move in self.order(moves, entry and entry[4], ply):
+            position.make(move)
+            value = self.min_value(alpha, beta, depth - 1, ply + 1)
+            position.unmake()
+            if value > v:
+                v, best = value, move
             if v >= beta:
-                return v
+                self.cutoff(move, depth, ply)
+                break
             alpha = max(alpha, v)
+        bound = UPPER if v <= alpha0 else LOWER if v >= beta else EXACT
+        table.store(key, depth, to_table(v, ply), bound, best)
         return v
 
-    def min_value(state, alpha, beta, depth):
-        opponent = get_opponent(player)
-        if is_terminal(state, opponent) or depth == 4:
-            return utility_of(state, player)
+    def min_value(self, alpha, beta, depth, ply):
+        position, table = self.position, self.table
+        value = position.utility(self.me)
+        if value:
+            return value - ply if value > 0 else value + ply  # prefer quicker wins
+        if depth == 0:
+            return position.evaluate(self.me)
+        self.tick()
+        # entries hold the opponent's view here, so values and bounds are mirrored
+        key = position.key
+        entry = table.probe(key)
+        if entry is not None and entry[1] >= depth:
+            value, bound = -from_table(entry[2], ply), entry[3]
+            if bound == EXACT or (bound == LOWER and value <= alpha) or (bound == UPPER and value >= beta):
+                table.cutoffs += 1
+                return value
+        moves = position.moves()
+        if not moves:
+            return WIN - ply
+        beta0 = beta
         v = float('inf')
-        for s in successors_of(state, opponent):
-            v = min(v, max_value(s, alpha, beta, depth + 1))
+        best = None
+        for move in self.order(moves, entry and entry[4], ply):
+            position.make(move)
+            value = self.max_value(alpha, beta, depth - 1, ply + 1)
+            position.unmake()
+            if value < v:
+                v, best = value, move
             if v <= alpha:
-                return v
+                self.cutoff(move, depth, ply)
+                break
             beta = min(beta, v)
+        bound = UPPER if v >= beta0 else LOWER if v <= alpha else EXACT
+        table.store(key, depth, to_table(-v, ply), bound, best)
         return v
 
-    return max(successors_of(board, player), key=lambda s: min_value(s, float('-inf'), float('inf'), 0))
+    def search_root(self, depth: int):
+        """One iteration. The best value so far is passed down as alpha, so
+        later root moves only need to be proven no better. self.best is
+        updated as soon as the previous best move has been re-searched, so a
+        timeout mid-iteration keeps any move proven better at the new depth."""
+        position = self.position
+        best, best_value = None, float('-inf')
+        for move in self.order(position.moves(), self.best, 0):
+            position.make(move)
+            value = self.min_value(best_value, float('inf'), depth - 1, 1)
+            position.unmake()
+            if value > best_value:
+                best, best_value = move, value
+                self.best, self.value = best, best_value
+        self.table.store(position.key, depth, best_value, EXACT, best)
+        self.depth = depth
 
+    def iterate(self, time_limit: Optional[float] = None, max_depth: Optional[int] = None,
+                first_depth: int = 1) -> Optional[Move]:
+        """Best move found before the time limit or max_depth, or None if
+        the side to move has no legal move and so has lost."""
+        position = self.position
+        moves = position.moves()
+        if not moves:
+            self.best, self.value, self.depth = None, -WIN, 0
+            return None
+        if self.best is None:
+            self.best = moves[0]
+        if len(moves) == 1:
+            return self.best
+        self.table.new_search()
+        self.deadline = perf_counter() + time_limit if time_limit is not None else None
+        root = len(position.history)
+        for depth in range(first_depth, (max_depth or MAX_PLY) + 1):
+            try:
+                self.search_root(depth)
+            except SearchTimeout:
+                while len(position.history) > root:
+                    position.unmake()
+                break
+            if abs(self.value) >= DECIDED:
+                break  # the game is decided within this horizon
+        return self.best
 
-def main():
-    board = initial_board(4)
-    current_player = PLAYER_ONE
-    display(board)
+    def principal_variation(self) -> List[Move]:
+        position = self.position
+        line = []
+        entry = self.table.probe(position.key)
+        while entry is not None and entry[4] in position.moves() and len(line) < self.depth:
+            line.append(entry[4])
+            position.make(entry[4])
+            entry = self.table.probe(position.key)
+        for _ in line:
+            position.unmake()
+        return line
 
-    while not is_terminal(board, current_player) and not is_terminal(board, get_opponent(current_player)):
-        if current_player == PLAYER_ONE:
-            board = alpha_beta_decision(board, PLAYER_ONE)
-            print("White (W) moves:")
-        else:
-            board = alpha_beta_decision(board, PLAYER_TWO)
-            print("Black (B) moves:")
-        display(board)
-        current_player = get_opponent(current_player)
 
-    print(f"Game over. Winner: {get_opponent(current_player)}")
+def best_move(position: Bitboard, depth: int = 4,
+              table: Optional[TranspositionTable] = None) -> Optional[Move]:
+    return AlphaBetaSearch(position, table).iterate(max_depth=depth)
+
+
+def timed_move(position: Bitboard, time_limit: float = 1.0,
+               table: Optional[TranspositionTable] = None) -> Optional[Move]:
+    return AlphaBetaSearch(position, table).iterate(time_limit=time_limit)
+
+
+def alpha_beta_decision(board: Board, player: str, time_limit: float = 1.0,
+                        table: Optional[TranspositionTable] = None) -> Optional[Board]:
+    position = Bitboard.from_board(board, player)
+    move = timed_move(position, time_limit, table)
+    if move is None:
+        return None  # player is blocked and has lost
+    position.make(move)
+    return position.to_board()
+
+
+def square_name(square: int, size: int) -> str:
+    return f"{chr(ord('a') + square % size)}{size - square // size}"
+
+
+def main(size: int = 8, time_limit: float = 1.0):
+    position = Bitboard.from_board(initial_board(size))
+    table = TranspositionTable()
+    display(position.to_board())
+
+    while not position.has_won(0) and not position.has_won(1) and position.moves():
+        name = "White (W)" if position.side == 0 else "Black (B)"
+        start = perf_counter()
+        search = AlphaBetaSearch(position, table)
+        move = search.iterate(time_limit=time_limit)
+        pv = " ".join(f"{square_name(a, size)}-{square_name(b, size)}" for a, b in search.principal_variation())
+        position.make(move)
+        print(f"{name} moves ({perf_counter() - start:.3f}s, depth {search.depth}, "
+              f"{search.nodes} nodes, value {search.value}, pv {pv}):")
+        display(position.to_board())
+
+    winner = 0 if position.has_won(0) else 1 if position.has_won(1) else 1 - position.side
+    print(f"Game over. Winner: {PLAYER_ONE if winner == 0 else PLAYER_TWO}")
+    print(f"Transposition table: {table}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import RawArray, Value
+from time import perf_counter, time
+from typing import Optional
+import os
+
+from breakthrough_alpha import (Bitboard, AlphaBetaSearch, TranspositionTable, SearchTimeout,
+                                Move, MAX_PLY, MAX_SIZE, WIN, DECIDED, initial_board, display)
+
+VALUE_OFFSET = 1 << 31
+NO_BOUND = -WIN - MAX_PLY - 1  # below every score, used as the initial shared alpha
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    TranspositionTable over a RawArray that every worker process maps.
+
+    Each slot is two 64-bit words: key ^ data and data, where data packs
+    value, depth, bound, move and generation. A reader only accepts a slot
+    whose words XOR back to its key, so torn writes from concurrent stores
+    look like misses and no lock is needed. The generation is set by the
+    parent for each search rather than bumped per process.
+    """
+
+    def __init__(self, slots):
+        self.words = slots
+        self.mask = len(slots) // 2 - 1
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    @staticmethod
+    def allocate(size: int = 1 << 18):
+        size = 1 << max(size - 1, 1).bit_length()
+        return RawArray('Q', 2 * size)
+
+    def new_search(self):
+        pass
+
+    def probe(self, key: int) -> Optional[tuple]:
+        self.probes += 1
+        index = 2 * (key & self.mask)
+        data = self.words[index + 1]
+        if not data or self.words[index] ^ data != key:
+            return None
+        self.hits += 1
+        return _unpack(key, data)
+
+    def store(self, key: int, depth: int, value: int, bound: int, move: Optional[Move]):
+        index = 2 * (key & self.mask)
+        old = self.words[index + 1]
+        if old and (old >> 55) == self.generation & 0xFF and depth < (old >> 32) & 0xFF:
+            return
+        data = ((value + VALUE_OFFSET)
+                | depth << 32 | bound << 40
+                | (move[0] << 42 | move[1] << 48 | 1 << 54 if move is not None else 0)
+                | (self.generation & 0xFF) << 55)
+        self.words[index] = key ^ data
+        self.words[index + 1] = data
+        self.stores += 1
+
+
+def _unpack(key: int, data: int) -> tuple:
+    move = ((data >> 42) & 63, (data >> 48) & 63) if data >> 54 & 1 else None
+    return (key, (data >> 32) & 0xFF, (data & 0xFFFFFFFF) - VALUE_OFFSET,
+            (data >> 40) & 3, move, data >> 55)
+
+
+# Per-process state, set once by _init_worker
+_table = None
+_alpha = None
+
+
+def _init_worker(slots, alpha) -> None:
+    global _table, _alpha
+    _table = SharedTranspositionTable(slots)
+    _alpha = alpha
+
+
+def _search_root_move(pieces: tuple, move: Move, depth: int, deadline: float,
+                      generation: int, open_window: bool = False) -> Optional[tuple]:
+    """
+    Search one root move to depth using the shared alpha as the lower bound,
+    or an open window if open_window is set. Returns (value, exact), or None
+    if the deadline passed first. Only exact values, those above the alpha
+    the search started with, raise the bound.
+    """
+    _table.generation = generation
+    position = Bitboard(*pieces)
+    search = AlphaBetaSearch(position, _table)
+    search.deadline = perf_counter() + deadline - time()
+    alpha = NO_BOUND if open_window else _alpha.value
+    position.make(move)
+    try:
+        value = search.min_value(alpha, float('inf'), depth - 1, 1)
+    except SearchTimeout:
+        return None
+    if value > alpha:
+        with _alpha.get_lock():
+            _alpha.value = max(_alpha.value, value)
+    return value, value > alpha
+
+
+def _lazy_smp_worker(pieces: tuple, deadline: float, generation: int, max_depth: Optional[int],
+                     worker: int) -> tuple:
+    # odd workers start one ply deeper so the pool does not move in lockstep
+    _table.generation = generation
+    search = AlphaBetaSearch(Bitboard(*pieces), _table)
+    move = search.iterate(time_limit=max(deadline - time(), 0), max_depth=max_depth,
+                          first_depth=1 + worker % 2)
+    return search.depth, move, search.value
+
+
+class ParallelSearch:
+    """
+    Breakthrough search over a pool of worker processes sharing one
+    transposition table.
+
+    root_split deepens iteratively in the parent process and, at each depth,
+    hands the root moves to the workers. The best value found so far is
+    kept in a shared alpha that each root search starts from. lazy_smp runs
+    a full iterative-deepening search in every worker on the same root and
+    lets the shared table pass results between them.
+    """
+
+    def __init__(self, workers: int = None, table_size: int = 1 << 18):
+        self.workers = workers or os.cpu_count()
+        self.alpha = Value('q', NO_BOUND)
+        self.slots = SharedTranspositionTable.allocate(table_size)
+        self.generation = 0
+        self.executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                            initargs=(self.slots, self.alpha))
+        self.depth = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.executor.shutdown()
+
+    def root_split(self, position: Bitboard, time_limit: float = 1.0,
+                   max_depth: Optional[int] = None) -> Optional[Move]:
+        moves = position.moves()
+        self.depth = 0
+        if not moves:
+            return None  # the side to move is blocked and has lost
+        best = moves[0]
+        if len(moves) == 1:
+            return best
+        self.generation += 1
+        pieces = (position.size, *position.pieces, position.side)
+        deadline = time() + time_limit
+        for depth in range(1, (max_depth or MAX_PLY) + 1):
+            self.alpha.value = NO_BOUND
+            ordered = [best] + [move for move in moves if move != best]
+            futures = [self.executor.submit(_search_root_move, pieces, move, depth, deadline,
+                                            self.generation) for move in ordered]
+            results = [future.result() for future in futures]
+            if results[0] is None:
+                break  # the previous best was not re-searched in time
+            value = max(result[0] for result in results if result is not None and result[1])
+            # A move that failed low onto the best value may tie with it; which
+            # moves failed low depends on worker timing, so re-search those
+            # with an open window and take the first best move in search order
+            ties = [i for i, result in enumerate(results)
+                    if result is not None and not result[1] and result[0] >= value]
+            futures = [self.executor.submit(_search_root_move, pieces, ordered[i], depth, deadline,
+                                            self.generation, True) for i in ties]
+            for i, future in zip(ties, futures):
+                results[i] = future.result()
+            best = next(move for move, result in zip(ordered, results)
+                        if result is not None and result[1] and result[0] == value)
+            if any(result is None for result in results):
+                break
+            self.depth = depth
+            if abs(value) >= DECIDED:
+                break
+        return best
+
+    def lazy_smp(self, position: Bitboard, time_limit: float = 1.0,
+                 max_depth: Optional[int] = None) -> Optional[Move]:
+        moves = position.moves()
+        if len(moves) <= 1:
+            self.depth = 0
+            return moves[0] if moves else None
+        self.generation += 1
+        pieces = (position.size, *position.pieces, position.side)
+        deadline = time() + time_limit
+        futures = [self.executor.submit(_lazy_smp_worker, pieces, deadline, self.generation,
+                                        max_depth, worker) for worker in range(self.workers)]
+        results = [future.result() for future in futures]
+        # deepest completed iteration wins, earlier workers break ties
+        self.depth, move, _ = max(results, key=lambda result: result[0])
+        return move
+
+
+if __name__ == '__main__':
+    position = Bitboard.from_board(initial_board(MAX_SIZE))
+    display(position.to_board())
+
+    start = perf_counter()
+    serial = AlphaBetaSearch(position)
+    move = serial.iterate(time_limit=1.0)
+    print(f"serial: move {move}, depth {serial.depth} in {perf_counter() - start:.2f}s")
+
+    with ParallelSearch() as search:
+        print(f"{search.workers} worker processes")
+        for name, search_fn in (("root split", search.root_split), ("lazy SMP", search.lazy_smp)):
+            start = perf_counter()
+            move = search_fn(position, 1.0)
+            print(f"{name}: move {move}, depth {search.depth} in {perf_counter() - start:.2f}s")
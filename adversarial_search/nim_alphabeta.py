@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
 from typing import List
 
 type Piles = List[int]
@@ -6,35 +8,78 @@ type Piles = List[int]
 def alpha_beta_decision(state: Piles) -> Piles:
     """
     Returns the best move for the computer using alpha-beta pruning.
+    The best value found so far is passed on as alpha to the remaining moves.
     """
-
-    def max_value(state, alpha, beta):
-        if is_terminal(state):
-            return utility_of(state)
-        v = float('-inf')
-        for successor in successors_of(state):
-            v = max(v, min_value(successor, alpha, beta))
-            if v >= beta:
-                return v
-            alpha = max(alpha, v)
-        return v
-
-    def min_value(state, alpha, beta):
-        if is_terminal(state):
-            return utility_of(state)
-        v = float('inf')
-        for successor in successors_of(state):
-            v = min(v, max_value(successor, alpha, beta))
-            if v <= alpha:
-                return v
-            beta = min(beta, v)
-        return v
-
-    best = max(successors_of(state), key=lambda s: min_value(
-        s, float('-inf'), float('inf')))
+    best, alpha = None, float('-inf')
+    for successor in successors_of(state):
+        v = min_value(successor, alpha, float('inf'))
+        if best is None or v > alpha:
+            best, alpha = successor, v
     return best
 
 
+def max_value(state, alpha, beta):
+    if is_terminal(state):
+        return utility_of(state)
+    v = float('-inf')
+    for successor in successors_of(state):
+        v = max(v, min_value(successor, alpha, beta))
+        if v >= beta:
+            return v
+        alpha = max(alpha, v)
+    return v
+
+
+def min_value(state, alpha, beta):
+    if is_terminal(state):
+        return utility_of(state)
+    v = float('inf')
+    for successor in successors_of(state):
+        v = min(v, max_value(successor, alpha, beta))
+        if v <= alpha:
+            return v
+        beta = min(beta, v)
+    return v
+
+
+# Root bound shared by the worker processes, set once by _init_worker
+_alpha = None
+
+
+def _init_worker(alpha) -> None:
+    global _alpha
+    _alpha = alpha
+
+
+def _root_value(successor: Piles) -> tuple[int, bool]:
+    alpha = _alpha.value
+    v = min_value(successor, alpha, float('inf'))
+    if v > alpha:
+        with _alpha.get_lock():
+            _alpha.value = max(_alpha.value, v)
+    # values at or below the alpha we started from are only upper bounds
+    return v, v > alpha
+
+
+def parallel_alpha_beta_decision(state: Piles, max_workers: int = None) -> Piles:
+    """
+    alpha_beta_decision with the root moves split over a process pool. The
+    workers share the best root value as alpha, so moves searched after a
+    good one can be cut off as in the serial version. Moves that failed low
+    onto the best value are re-searched with an open window, and ties go to
+    the first move, so the result matches alpha_beta_decision.
+    """
+    successors = successors_of(state)
+    alpha = Value('i', -2)  # below every utility
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                             initargs=(alpha,)) as executor:
+        results = list(executor.map(_root_value, successors))
+    best = max(v for v, is_exact in results if is_exact)
+    for i, (v, is_exact) in enumerate(results):
+        if v == best and (is_exact or min_value(successors[i], float('-inf'), float('inf')) == best):
+            return successors[i]
+
+
 def is_terminal(state: Piles) -> bool:
     # Terminal if all piles are 1 or 2
     return all(pile <= 2 for pile in state)
@@ -26,7 +26,13 @@ def alpha_beta_decision(state: Piles) -> Piles:
             beta = min(beta, v)
         return v
 
-    return min(successors_of(state), key=lambda s: max_value(s, float('-inf'), float('inf')))
+    # pass the best value so far on as beta to the remaining moves
+    best, beta = None, float('inf')
+    for successor in successors_of(state):
+        v = max_value(successor, float('-inf'), beta)
+        if best is None or v < beta:
+            best, beta = successor, v
+    return best
 
 
 def is_terminal(state: Piles) -> bool:
@@ -0,0 +1,195 @@
+import heapq
+from array import array
+from time import perf_counter
+from graph_search import Node, SearchStats, a_star_search
+
+
+class CSRGraph:
+    """
+    Weighted directed graph in compressed sparse row form. States are
+    numbered 0..n-1 once (ids maps state -> id, states maps back), and
+    the edges leaving node i are targets[offsets[i]:offsets[i + 1]] with
+    the matching entries of weights.
+    """
+
+    def __init__(self, states: list, offsets: array, targets: array, weights: array):
+        self.states = states
+        self.ids = {state: i for i, state in enumerate(states)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_state_space(cls, state_space: dict, cost_fn=None):
+        """
+        One-time conversion of a state_space dict, calling cost_fn once per
+        edge (every edge costs 1 without one).
+        """
+        states = list(state_space)
+        ids = {state: i for i, state in enumerate(states)}
+        for children in state_space.values():
+            for child in children:
+                if child not in ids:
+                    ids[child] = len(states)
+                    states.append(child)
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for state in states:
+            for child in state_space.get(state, ()):
+                targets.append(ids[child])
+                weights.append(1 if cost_fn is None else cost_fn(state, child))
+            offsets.append(len(targets))
+        return cls(states, offsets, targets, weights)
+
+    @classmethod
+    def from_grid(cls, rows: int, cols: int, blocked=frozenset()):
+        """4-connected grid of (row, col) cells with unit step costs."""
+        state_space = {}
+        for r in range(rows):
+            for c in range(cols):
+                if (r, c) in blocked:
+                    continue
+                state_space[(r, c)] = [
+                    (nr, nc) for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                    if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in blocked]
+        return cls.from_state_space(state_space)
+
+    def reversed(self):
+        """The same graph with every edge turned around."""
+        n = len(self)
+        offsets = array('q', [0]) * (n + 1)
+        for v in self.targets:
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        position = array('q', offsets[:-1])
+        targets = array('q', [0]) * len(self.targets)
+        weights = array('d', [0.0]) * len(self.weights)
+        for u in range(n):
+            for e in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[e]
+                targets[position[v]] = u
+                weights[position[v]] = self.weights[e]
+                position[v] += 1
+        reversed_graph = CSRGraph.__new__(CSRGraph)
+        reversed_graph.states = self.states
+        reversed_graph.ids = self.ids
+        reversed_graph.offsets = offsets
+        reversed_graph.targets = targets
+        reversed_graph.weights = weights
+        return reversed_graph
+
+    def __len__(self):
+        return len(self.states)
+
+
+def shortest_distances(graph: CSRGraph, source: int) -> array:
+    """Dijkstra from node id source to every node; unreachable nodes get inf."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array('d', [float('inf')]) * len(graph)
+    distances[source] = 0.0
+    frontier = [(0.0, source)]
+    while frontier:
+        d, u = heapq.heappop(frontier)
+        if d > distances[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            d_v = d + weights[e]
+            if d_v < distances[v]:
+                distances[v] = d_v
+                heapq.heappush(frontier, (d_v, v))
+    return distances
+
+
+def csr_a_star_search(graph: CSRGraph, start, goal, heuristic_fn=None, stats: SearchStats = None):
+    """
+    A* over a CSRGraph, or Dijkstra when heuristic_fn is None. Edge costs
+    are read from the weight array and heuristic_fn is called at most once
+    per node, so the inner loop makes no Python function calls per edge.
+    Returns the same list of Nodes as a_star_search.
+    """
+    source, target = graph.ids[start], graph.ids[goal]
+    n = len(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    inf = float('inf')
+    best_g = array('d', [inf]) * n
+    parent = array('q', [-1]) * n
+    if heuristic_fn is None:
+        h = array('d', [0.0]) * n
+    else:
+        h = array('d', [-1.0]) * n  # -1 marks a heuristic not computed yet
+        states = graph.states
+        h[source] = heuristic_fn(start)
+
+    best_g[source] = 0
+    frontier = [(h[source], 0.0, source)]
+    while frontier:
+        f, g, u = heapq.heappop(frontier)
+        if g > best_g[u]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        if u == target:
+            break
+
+        if stats is not None:
+            stats.nodes_expanded += 1
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            g_v = g + weights[e]
+            if g_v < best_g[v]:
+                if stats is not None:
+                    stats.nodes_generated += 1
+                    if best_g[v] < inf:
+                        stats.nodes_regenerated += 1
+                best_g[v] = g_v
+                parent[v] = u
+                h_v = h[v]
+                if h_v < 0:
+                    h_v = h[v] = heuristic_fn(states[v])
+                heapq.heappush(frontier, (g_v + h_v, g_v, v))
+    else:
+        return None
+
+    indices = [target]
+    while parent[indices[-1]] >= 0:
+        indices.append(parent[indices[-1]])
+    node = None
+    for i in reversed(indices):
+        node = Node(graph.states[i], node, g=best_g[i], h=h[i])
+    return node.path()
+
+
+def dijkstra_search(graph: CSRGraph, start, goal, stats: SearchStats = None):
+    return csr_a_star_search(graph, start, goal, None, stats)
+
+
+if __name__ == '__main__':
+    from graph_search import graph, cost_fn, heuristic_fn
+
+    print("A* over CSR graph:")
+    csr = CSRGraph.from_state_space(graph, cost_fn)
+    for node in csr_a_star_search(csr, 'A', 'J', heuristic_fn):
+        print(node)
+
+    size = 300
+    blocked = {(r, size // 2) for r in range(size - 1)}
+    start, goal = (0, 0), (0, size - 1)
+
+    def manhattan(state):
+        return abs(state[0] - goal[0]) + abs(state[1] - goal[1])
+
+    print(f"\n{size} x {size} grid with a wall:")
+    csr = CSRGraph.from_grid(size, size, blocked)
+    state_space = {state: [csr.states[v] for v in csr.targets[csr.offsets[u]:csr.offsets[u + 1]]]
+                   for u, state in enumerate(csr.states)}
+    for name, heuristic in (("no heuristic", lambda state: 0), ("Manhattan", manhattan)):
+        started = perf_counter()
+        path = a_star_search(start, goal, state_space, lambda a, b: 1, heuristic)
+        print(f"dict A*, {name}: cost {path[-1].g}, {perf_counter() - started:.3f}s")
+        started = perf_counter()
+        path = csr_a_star_search(csr, start, goal, heuristic)
+        print(f"CSR A*, {name}: cost {path[-1].g:g}, {perf_counter() - started:.3f}s")
@@ -1,14 +1,20 @@
 import heapq
-from typing import Any
+from collections import deque, OrderedDict
+from functools import lru_cache
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable
 
 
 class Node:
-    def __init__(self, state: Any, parent=None, g=0, h=0):
+    __slots__ = ("state", "parent", "g", "h", "f")
+
+    def __init__(self, state: Any, parent=None, g=0, h=0, f=None):
         self.state = state
         self.parent = parent
         self.g = g  # cost so far
         self.h = h  # heuristic estimate
-        self.f = g + h
+        self.f = g + h if f is None else f  # priority, overridden by weighted searches
 
     def path(self):
         node, result = self, [self]
@@ -24,6 +30,20 @@ class Node:
         return f"State: {self.state} - g: {self.g}, h: {self.h}, f: {self.f}"
 
 
+class SearchStats:
+    """Counters filled in by the search functions when passed as stats."""
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.nodes_regenerated = 0  # known states reached again by a cheaper path
+        self.stale_pops = 0
+
+    def __repr__(self):
+        return (f"Expanded: {self.nodes_expanded} - Generated: {self.nodes_generated}"
+                f" - Regenerated: {self.nodes_regenerated} - Stale pops: {self.stale_pops}")
+
+
 class PriorityQueue:
     def __init__(self):
         self.elements = []
@@ -38,8 +58,171 @@ class PriorityQueue:
         return not self.elements
 
 
-def greedy_best_first_search(start, goal, state_space, heuristic_fn):
-    frontier = PriorityQueue()
+class IndexedPriorityQueue(PriorityQueue):
+    """
+    Priority queue holding at most one live entry per state, ordered by
+    (f, h, insertion order): among equal f the deeper node (lower h) wins
+    and remaining ties are first-in first-out.
+    Pushing a node that is no better than the queued entry for its state
+    is ignored; a better one replaces it by marking the old heap entry
+    removed (lazy deletion). The heap is compacted whenever removed
+    entries outnumber live ones, so it stays within twice the number of
+    distinct queued states.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.entries = {}  # state -> [f, h, insertion count, node or None]
+        self.counter = count()
+        self.removed = 0
+
+    def push(self, item: Node) -> bool:
+        """Queue item, returning False if an equal or better entry exists."""
+        entry = self.entries.get(item.state)
+        if entry is not None:
+            if (entry[0], entry[1]) <= (item.f, item.h):
+                return False
+            entry[-1] = None
+            self.removed += 1
+        entry = [item.f, item.h, next(self.counter), item]
+        self.entries[item.state] = entry
+        heapq.heappush(self.elements, entry)
+        if self.removed > len(self.entries):
+            self.compact()
+        return True
+
+    def pop(self) -> Node:
+        while True:
+            node = heapq.heappop(self.elements)[-1]
+            if node is not None:
+                del self.entries[node.state]
+                return node
+            self.removed -= 1
+
+    def compact(self) -> None:
+        self.elements = [entry for entry in self.elements if entry[-1] is not None]
+        heapq.heapify(self.elements)
+        self.removed = 0
+
+    def empty(self) -> bool:
+        return not self.entries
+
+    def __contains__(self, state):
+        return state in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LazyStateSpace:
+    """
+    Drop-in replacement for a state_space dict that calls successor_fn on
+    demand. Successor lists of the max_cached most recently used states
+    are memoized.
+    """
+
+    def __init__(self, successor_fn: Callable[[Any], list], max_cached: int = 4096):
+        self.successor_fn = lru_cache(maxsize=max_cached)(successor_fn)
+
+    def __getitem__(self, state):
+        return self.successor_fn(state)
+
+    def cache_info(self):
+        return self.successor_fn.cache_info()
+
+
+class CachedHeuristic:
+    """
+    Memoizes an expensive heuristic for the max_cached most recently used
+    states. batch() scores a list of states, sending every uncached one
+    through a single batch_fn call when one is given (e.g. a vectorized
+    NumPy function); the searches use it for all successors of a node.
+    heuristic_fn may be omitted when batch_fn is given.
+    """
+
+    def __init__(self, heuristic_fn: Callable[[Any], float] = None, max_cached: int = 100_000,
+                 batch_fn: Callable[[list], list] = None):
+        self.heuristic_fn = heuristic_fn
+        self.batch_fn = batch_fn
+        self.max_cached = max_cached
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, state) -> float:
+        if state in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(state)
+            return self.cache[state]
+        self.misses += 1
+        if self.heuristic_fn is None:
+            h = self.batch_fn([state])[0]
+        else:
+            h = self.heuristic_fn(state)
+        self._store(state, h)
+        return h
+
+    def batch(self, states: list) -> list:
+        known = {}
+        missing = []
+        for state in states:
+            if state in self.cache:
+                self.cache.move_to_end(state)
+                known[state] = self.cache[state]
+            elif state not in known:
+                known[state] = None
+                missing.append(state)
+        self.hits += len(states) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            if self.batch_fn is None:
+                values = [self.heuristic_fn(state) for state in missing]
+            else:
+                values = self.batch_fn(missing)
+            for state, h in zip(missing, values):
+                known[state] = h
+                self._store(state, h)
+        return [known[state] for state in states]
+
+    def _store(self, state, h) -> None:
+        self.cache[state] = h
+        if len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+
+    def __repr__(self):
+        return f"Hits: {self.hits} - Misses: {self.misses} - Cached: {len(self.cache)}"
+
+
+def evaluate_heuristic(heuristic_fn, states: list) -> list:
+    """h for every state, in one call if heuristic_fn has a batch method."""
+    batch = getattr(heuristic_fn, "batch", None)
+    if batch is not None:
+        return batch(states)
+    return [heuristic_fn(state) for state in states]
+
+
+def breadth_first_search(start, goal, state_space, stats: SearchStats = None):
+    """Unweighted baseline: every step costs 1, heuristics are ignored."""
+    frontier = deque([Node(start)])
+    reached = {start}
+
+    while frontier:
+        current = frontier.popleft()
+        if current.state == goal:
+            return current.path()
+
+        if stats is not None:
+            stats.nodes_expanded += 1
+        for neighbor in state_space[current.state]:
+            if neighbor not in reached:
+                reached.add(neighbor)
+                frontier.append(Node(neighbor, current, g=current.g + 1))
+                if stats is not None:
+                    stats.nodes_generated += 1
+
+
+def greedy_best_first_search(start, goal, state_space, heuristic_fn, stats: SearchStats = None):
+    frontier = IndexedPriorityQueue()
     node = Node(start, h=heuristic_fn(start))
     frontier.push(node)
     visited = set()
@@ -50,30 +233,334 @@ def greedy_best_first_search(start, goal, state_space, heuristic_fn):
             return current.path()
 
         visited.add(current.state)
-        for neighbor in state_space[current.state]:
-            if neighbor not in visited:
-                h = heuristic_fn(neighbor)
-                # g=0 for greedy
-                frontier.push(Node(neighbor, current, g=0, h=h))
+        if stats is not None:
+            stats.nodes_expanded += 1
+        neighbors = [neighbor for neighbor in state_space[current.state]
+                     if neighbor not in visited]
+        for neighbor, h in zip(neighbors, evaluate_heuristic(heuristic_fn, neighbors)):
+            # g=0 for greedy
+            pushed = frontier.push(Node(neighbor, current, g=0, h=h))
+            if stats is not None and pushed:
+                stats.nodes_generated += 1
 
 
-def a_star_search(start, goal, state_space, cost_fn, heuristic_fn):
-    frontier = PriorityQueue()
-    node = Node(start, g=0, h=heuristic_fn(start))
-    frontier.push(node)
-    visited = {}
+def a_star_search(start, goal, state_space, cost_fn, heuristic_fn, stats: SearchStats = None):
+    """
+    A* keeping the best known g for every state. A neighbor is only pushed
+    when it improves on that g, and popped nodes that were overtaken by a
+    cheaper path are discarded, so each state is expanded once for a
+    consistent heuristic.
+    """
+    return weighted_a_star_search(start, goal, state_space, cost_fn, heuristic_fn, 1, stats)
+
+
+def weighted_a_star_search(start, goal, state_space, cost_fn, heuristic_fn,
+                           weight: float = 1.5, stats: SearchStats = None):
+    """
+    A* ordered by f = g + weight * h. With an admissible heuristic the
+    solution costs at most weight times the optimum, and larger weights
+    expand far fewer nodes. weight=1 is plain A*.
+    """
+    frontier = IndexedPriorityQueue()
+    h = heuristic_fn(start)
+    frontier.push(Node(start, g=0, h=h, f=weight * h))
+    best_g = {start: 0}
 
     while not frontier.empty():
         current = frontier.pop()
+        if current.g > best_g[current.state]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
         if current.state == goal:
             return current.path()
 
-        visited[current.state] = current.g
+        if stats is not None:
+            stats.nodes_expanded += 1
+        improved, costs = [], []
         for neighbor in state_space[current.state]:
             g = current.g + cost_fn(current.state, neighbor)
+            if g < best_g.get(neighbor, float('inf')):
+                improved.append(neighbor)
+                costs.append(g)
+        for neighbor, g, h in zip(improved, costs, evaluate_heuristic(heuristic_fn, improved)):
+            # With float costs an improved g can still round to an equal f;
+            # only a node that actually replaced the queued one is recorded
+            if not frontier.push(Node(neighbor, current, g=g, h=h, f=g + weight * h)):
+                continue
+            if stats is not None:
+                stats.nodes_generated += 1
+                if neighbor in best_g:
+                    stats.nodes_regenerated += 1
+            best_g[neighbor] = g
+
+
+def anytime_a_star_search(start, goal, state_space, cost_fn, heuristic_fn,
+                          weight: float = 3.0, time_limit: float = None,
+                          stats: SearchStats = None):
+    """
+    Anytime weighted A*: a generator yielding solution paths of strictly
+    decreasing cost. The first comes quickly from the weighted search;
+    the search then continues, pruning nodes whose g + h cannot beat the
+    incumbent. It stops after time_limit seconds, or when the frontier is
+    empty, in which case the last path is optimal for an admissible heuristic.
+    """
+    deadline = None if time_limit is None else perf_counter() + time_limit
+    frontier = IndexedPriorityQueue()
+    h = heuristic_fn(start)
+    frontier.push(Node(start, g=0, h=h, f=weight * h))
+    best_g = {start: 0}
+    bound = float('inf')
+
+    while not frontier.empty():
+        if deadline is not None and perf_counter() > deadline:
+            return
+        current = frontier.pop()
+        if current.g > best_g[current.state] or current.g + current.h >= bound:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        if current.state == goal:
+            bound = current.g
+            yield current.path()
+            continue
+
+        if stats is not None:
+            stats.nodes_expanded += 1
+        for neighbor in state_space[current.state]:
+            g = current.g + cost_fn(current.state, neighbor)
+            if g >= best_g.get(neighbor, float('inf')):
+                continue
             h = heuristic_fn(neighbor)
-            if neighbor not in visited or g < visited[neighbor]:
-                frontier.push(Node(neighbor, current, g=g, h=h))
+            if g + h >= bound:
+                continue
+            if not frontier.push(Node(neighbor, current, g=g, h=h, f=g + weight * h)):
+                continue
+            if stats is not None:
+                stats.nodes_generated += 1
+                if neighbor in best_g:
+                    stats.nodes_regenerated += 1
+            best_g[neighbor] = g
+
+
+def beam_search(start, goal, state_space, cost_fn, heuristic_fn,
+                beam_width: int = 10, stats: SearchStats = None):
+    """
+    Breadth-first search that only keeps the beam_width best nodes (by
+    g + h) of each layer. Memory and time per layer are bounded, at the
+    price of completeness and optimality.
+    """
+    beam = [Node(start, g=0, h=heuristic_fn(start))]
+    best_g = {start: 0}
+
+    while beam:
+        candidates = IndexedPriorityQueue()
+        layer_g = {}
+        for current in beam:
+            if current.state == goal:
+                return current.path()
+
+            if stats is not None:
+                stats.nodes_expanded += 1
+            improved, costs = [], []
+            for neighbor in state_space[current.state]:
+                g = current.g + cost_fn(current.state, neighbor)
+                if g < min(best_g.get(neighbor, float('inf')), layer_g.get(neighbor, float('inf'))):
+                    improved.append(neighbor)
+                    costs.append(g)
+            for neighbor, g, h in zip(improved, costs, evaluate_heuristic(heuristic_fn, improved)):
+                # as in weighted_a_star_search, a rejected push must not lower the g on record
+                if not candidates.push(Node(neighbor, current, g=g, h=h)):
+                    continue
+                if stats is not None:
+                    stats.nodes_generated += 1
+                layer_g[neighbor] = g
+
+        # only states kept in the beam get a best_g; one cut by the width
+        # may still be reached later through a node that was kept
+        beam = []
+        while not candidates.empty() and len(beam) < beam_width:
+            node = candidates.pop()
+            best_g[node.state] = node.g
+            beam.append(node)
+
+
+def ida_star_search(start, goal, state_space, cost_fn, heuristic_fn, stats: SearchStats = None):
+    """
+    Iterative deepening A*: depth-first searches bounded by f = g + h,
+    raising the bound to the smallest f that exceeded it each iteration.
+    Only the current path and its successor iterators are kept, so memory
+    grows with solution depth rather than with the number of nodes.
+    Optimal for an admissible heuristic; returns None if goal is unreachable.
+    """
+    root = Node(start, g=0, h=heuristic_fn(start))
+    if start == goal:
+        return root.path()
+    bound = root.f
+
+    while True:
+        next_bound = float('inf')
+        on_path = {start}
+        stack = [(root, iter(state_space[start]))]
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in on_path:
+                    break
+            else:
+                stack.pop()
+                on_path.discard(current.state)
+                continue
+
+            g = current.g + cost_fn(current.state, neighbor)
+            child = Node(neighbor, current, g=g, h=heuristic_fn(neighbor))
+            if stats is not None:
+                stats.nodes_generated += 1
+            if child.f > bound:
+                next_bound = min(next_bound, child.f)
+                continue
+            if neighbor == goal:
+                return child.path()
+
+            on_path.add(neighbor)
+            stack.append((child, iter(state_space[neighbor])))
+            if stats is not None:
+                stats.nodes_expanded += 1
+
+        if next_bound == float('inf'):
+            return None
+        bound = next_bound
+
+
+def sma_star_search(start, goal, state_space, cost_fn, heuristic_fn,
+                    max_nodes: int = 1000, stats: SearchStats = None):
+    """
+    Simplified memory-bounded A*: A* over a search tree that never holds
+    more than max_nodes nodes. Successors are generated one at a time. When
+    memory is full, the shallowest leaf with the highest f is forgotten and
+    its f is remembered by its parent, which goes back on the open list
+    with f = min(live children, forgotten children) and later regenerates
+    only its forgotten successors, cheapest first.
+    Optimal as long as max_nodes is larger than the depth of the shallowest
+    optimal solution; returns None when no solution fits.
+    """
+    inf = float('inf')
+    root = Node(start, g=0, h=heuristic_fn(start))
+    depth = {root: 0}
+    children = {root: []}
+    pending = {root: None}  # successors not generated yet, None before the first expansion
+    forgotten = {root: {}}  # forgotten child state -> its f
+    entry_ids = {}
+    open_heap, worst_leaves = [], []
+    counter = count()
+
+    def is_open(node):
+        return pending[node] is None or pending[node] or forgotten[node]
+
+    def refresh(node):
+        # re-queue node under its current f; older heap entries become stale
+        entry_id = next(counter)
+        entry_ids[node] = entry_id
+        if is_open(node):
+            heapq.heappush(open_heap, (node.f, -depth[node], entry_id, node))
+        if node.parent is not None and not children[node]:
+            heapq.heappush(worst_leaves, (-node.f, depth[node], entry_id, node))
+
+    def pop_open():
+        while open_heap:
+            entry = heapq.heappop(open_heap)
+            node = entry[-1]
+            if entry_ids.get(node) == entry[2] and is_open(node):
+                entry_ids[node] = None  # the caller refreshes it
+                return node
+
+    def pop_worst(keep):
+        while worst_leaves:
+            entry = heapq.heappop(worst_leaves)
+            node = entry[-1]
+            if node is not keep and entry_ids.get(node) == entry[2] and not children[node]:
+                return node
+
+    def backup(node):
+        # A node with every successor accounted for takes the lowest f among
+        # its children, live or forgotten
+        while node is not None and pending[node] == []:
+            f = min(min((child.f for child in children[node]), default=inf),
+                    min(forgotten[node].values(), default=inf))
+            if f == node.f:
+                break
+            node.f = f
+            refresh(node)
+            node = node.parent
+
+    def forget(node):
+        parent = node.parent
+        children[parent].remove(node)
+        forgotten[parent][node.state] = node.f
+        del depth[node], children[node], pending[node], forgotten[node], entry_ids[node]
+        backup(parent)
+        refresh(parent)
+
+    refresh(root)
+    size = 1
+
+    while True:
+        best = pop_open()
+        if best is None or best.f == inf:
+            return None
+        if best.state == goal:
+            return best.path()
+
+        if pending[best] is None:
+            if stats is not None:
+                stats.nodes_expanded += 1
+            on_path = {node.state for node in best.path()}
+            pending[best] = [neighbor for neighbor in reversed(state_space[best.state])
+                             if neighbor not in on_path]
+        if not pending[best] and not forgotten[best]:
+            # Dead end: nothing left to generate below best
+            best.f = inf
+            refresh(best)
+            backup(best.parent)
+            continue
+
+        # Make room before picking the successor, so that backing up the
+        # forgotten leaf still sees every remembered f of best's children
+        if size >= max_nodes:
+            worst = pop_worst(best)
+            if worst is None:
+                return None  # memory holds nothing but the path to best
+            forget(worst)
+            size -= 1
+
+        if pending[best]:
+            neighbor = pending[best].pop()
+            remembered = 0
+        else:
+            neighbor = min(forgotten[best], key=forgotten[best].get)
+            remembered = forgotten[best].pop(neighbor)
+            if stats is not None:
+                stats.nodes_regenerated += 1
+
+        g = best.g + cost_fn(best.state, neighbor)
+        child = Node(neighbor, best, g=g, h=heuristic_fn(neighbor))
+        child.f = max(best.f, child.f, remembered)  # pathmax keeps f non-decreasing
+        depth[child] = depth[best] + 1
+        if neighbor != goal and depth[child] >= max_nodes - 1:
+            child.f = inf  # no room left below this node for a solution
+        children[child] = []
+        pending[child] = None
+        forgotten[child] = {}
+        children[best].append(child)
+        size += 1
+        if stats is not None:
+            stats.nodes_generated += 1
+        refresh(child)
+        backup(best)
+        refresh(best)
 
 
 # Example test graph and functions
@@ -119,6 +606,32 @@ if __name__ == "__main__":
         print(node)
 
     print("\nA* Search:")
-    path = a_star_search('A', 'J', graph, cost_fn, heuristic_fn)
+    stats = SearchStats()
+    path = a_star_search('A', 'J', graph, cost_fn, heuristic_fn, stats)
+    for node in path:
+        print(node)
+    print(stats)
+
+    print("\nWeighted A* Search (w = 2):")
+    path = weighted_a_star_search('A', 'J', graph, cost_fn, heuristic_fn, weight=2)
+    for node in path:
+        print(node)
+
+    print("\nAnytime A* Search:")
+    for path in anytime_a_star_search('A', 'J', graph, cost_fn, heuristic_fn, time_limit=1.0):
+        print(f"Found path with cost {path[-1].g}: {[node.state for node in path]}")
+
+    print("\nBeam Search (width 2):")
+    path = beam_search('A', 'J', graph, cost_fn, heuristic_fn, beam_width=2)
+    for node in path:
+        print(node)
+
+    print("\nIDA* Search:")
+    path = ida_star_search('A', 'J', graph, cost_fn, heuristic_fn)
+    for node in path:
+        print(node)
+
+    print("\nSMA* Search (max 5 nodes):")
+    path = sma_star_search('A', 'J', graph, cost_fn, heuristic_fn, max_nodes=5)
     for node in path:
         print(node)
@@ -0,0 +1,207 @@
+import math
+from graph_search import IndexedPriorityQueue, Node, SearchStats, a_star_search
+
+SQRT2 = math.sqrt(2)
+
+
+class Grid:
+    """
+    Occupancy grid with uniform step costs. States are (row, col) cells;
+    moves go to the 4 (or, with diagonal=True, 8) neighbouring free cells,
+    straight steps cost 1 and diagonal steps sqrt(2).
+    """
+
+    def __init__(self, rows: int, cols: int, blocked=frozenset()):
+        self.rows = rows
+        self.cols = cols
+        self.blocked = set(blocked)
+
+    @classmethod
+    def from_strings(cls, lines: list[str]):
+        """Build a grid from text, with '#' marking blocked cells."""
+        blocked = {(r, c) for r, line in enumerate(lines) for c, cell in enumerate(line) if cell == '#'}
+        return cls(len(lines), max(map(len, lines)), blocked)
+
+    def passable(self, r: int, c: int) -> bool:
+        return 0 <= r < self.rows and 0 <= c < self.cols and (r, c) not in self.blocked
+
+    def state_space(self, diagonal: bool = False) -> dict:
+        """The grid as a state_space dict, for the other searches."""
+        steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if diagonal:
+            steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        return {(r, c): [(r + dr, c + dc) for dr, dc in steps if self.passable(r + dr, c + dc)]
+                for r in range(self.rows) for c in range(self.cols) if self.passable(r, c)}
+
+
+def cost_fn(a, b):
+    return SQRT2 if a[0] != b[0] and a[1] != b[1] else 1
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def octile(a, b):
+    dr, dc = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+
+
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+def jump_point_search(grid: Grid, start, goal, diagonal: bool = False, stats: SearchStats = None):
+    """
+    A* that only puts jump points on the frontier. From each node it scans
+    in straight (and diagonal) lines, skipping every cell whose optimal
+    paths can be taken through other cells just as cheaply, and stops only
+    where a wall opens up a forced neighbour or the goal is in line.
+    On open maps this expands a small fraction of the cells A* does.
+    Returns the full cell-by-cell path in the same format as a_star_search.
+    """
+    passable = grid.passable
+    heuristic = octile if diagonal else manhattan
+
+    def jump_straight(r, c, dr, dc):
+        while True:
+            r, c = r + dr, c + dc
+            if not passable(r, c):
+                return None
+            if (r, c) == goal:
+                return r, c
+            if dr == 0:
+                # Moving sideways: a wall behind above/below opens a new direction
+                for side in (-1, 1):
+                    if diagonal:
+                        if passable(r + side, c + dc) and not passable(r + side, c):
+                            return r, c
+                    elif passable(r + side, c) and not passable(r + side, c - dc):
+                        return r, c
+            elif diagonal:
+                for side in (-1, 1):
+                    if passable(r + dr, c + side) and not passable(r, c + side):
+                        return r, c
+            else:
+                # Moving vertically on a 4-connected grid: every row is scanned sideways
+                if jump_straight(r, c, 0, -1) or jump_straight(r, c, 0, 1):
+                    return r, c
+
+    def jump_diagonal(r, c, dr, dc):
+        while True:
+            r, c = r + dr, c + dc
+            if not passable(r, c):
+                return None
+            if (r, c) == goal:
+                return r, c
+            if (passable(r - dr, c + dc) and not passable(r - dr, c)) or \
+                    (passable(r + dr, c - dc) and not passable(r, c - dc)):
+                return r, c
+            if jump_straight(r, c, dr, 0) or jump_straight(r, c, 0, dc):
+                return r, c
+
+    def directions(node):
+        r, c = node.state
+        if node.parent is None:
+            steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            if diagonal:
+                steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+            return steps
+        pr, pc = node.parent.state
+        dr, dc = _sign(r - pr), _sign(c - pc)
+        if dr and dc:
+            steps = [(dr, 0), (0, dc), (dr, dc)]
+            if not passable(r - dr, c):
+                steps.append((-dr, dc))
+            if not passable(r, c - dc):
+                steps.append((dr, -dc))
+            return steps
+        if diagonal:
+            steps = [(dr, dc)]
+            for side in (-1, 1):
+                if dr == 0 and not passable(r + side, c):
+                    steps.append((side, dc))
+                if dc == 0 and not passable(r, c + side):
+                    steps.append((dr, side))
+            return steps
+        if dc:
+            steps = [(0, dc)]
+            for side in (-1, 1):
+                if passable(r + side, c) and not passable(r + side, c - dc):
+                    steps.append((side, 0))
+            return steps
+        return [(dr, 0), (0, -1), (0, 1)]
+
+    frontier = IndexedPriorityQueue()
+    frontier.push(Node(start, g=0, h=heuristic(start, goal)))
+    best_g = {start: 0}
+
+    while not frontier.empty():
+        current = frontier.pop()
+        if current.g > best_g[current.state]:
+            continue
+        if current.state == goal:
+            return _fill_in(current.path(), heuristic, goal)
+
+        if stats is not None:
+            stats.nodes_expanded += 1
+        r, c = current.state
+        for dr, dc in directions(current):
+            if dr and dc:
+                point = jump_diagonal(r, c, dr, dc)
+            else:
+                point = jump_straight(r, c, dr, dc)
+            if point is None:
+                continue
+            g = current.g + octile(current.state, point)
+            if g >= best_g.get(point, float('inf')):
+                continue
+            if not frontier.push(Node(point, current, g=g, h=heuristic(point, goal))):
+                continue
+            best_g[point] = g
+            if stats is not None:
+                stats.nodes_generated += 1
+
+
+def _fill_in(jump_points: list[Node], heuristic, goal) -> list[Node]:
+    """Expand a path of jump points into every cell along it."""
+    node = None
+    for point in jump_points:
+        if node is None:
+            node = Node(point.state, g=0, h=point.h)
+            continue
+        r, c = node.state
+        dr, dc = _sign(point.state[0] - r), _sign(point.state[1] - c)
+        while (r, c) != point.state:
+            r, c = r + dr, c + dc
+            node = Node((r, c), node, g=node.g + cost_fn(node.state, (r, c)), h=heuristic((r, c), goal))
+    return node.path()
+
+
+if __name__ == '__main__':
+    lines = [
+        "..........#.........",
+        "..........#.........",
+        "..........#....#....",
+        "...####...#....#....",
+        "..........#....#....",
+        "...............#....",
+        "..........#....#....",
+        "..........#.........",
+    ]
+    grid = Grid.from_strings(lines)
+    start, goal = (0, 0), (0, 19)
+
+    for diagonal in (False, True):
+        heuristic = octile if diagonal else manhattan
+        name = "8-connected" if diagonal else "4-connected"
+        stats = SearchStats()
+        path = a_star_search(start, goal, grid.state_space(diagonal), cost_fn,
+                             lambda state: heuristic(state, goal), stats)
+        print(f"{name} A*: cost {path[-1].g:.3f}, expanded {stats.nodes_expanded}")
+        stats = SearchStats()
+        path = jump_point_search(grid, start, goal, diagonal, stats)
+        print(f"{name} JPS: cost {path[-1].g:.3f}, expanded {stats.nodes_expanded}")
+        cells = {node.state for node in path}
+        for r, line in enumerate(lines):
+            print("".join('*' if (r, c) in cells else cell for c, cell in enumerate(line)))
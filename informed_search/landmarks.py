@@ -0,0 +1,229 @@
+import heapq
+import random
+from array import array
+from time import perf_counter
+from csr_graph import CSRGraph, csr_a_star_search, shortest_distances
+from graph_search import Node, SearchStats
+
+
+class Landmarks:
+    """
+    ALT preprocessing (A*, Landmarks, Triangle inequality) for a CSRGraph.
+    For every landmark L the exact distances d(L, v) and d(v, L) to all
+    nodes are stored, so for any target t the triangle inequality gives
+    the consistent lower bound
+        d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)).
+    Built once per graph and shared by every later query; a query with
+    both endpoints known only takes the max over its `active` best terms.
+    """
+
+    def __init__(self, graph: CSRGraph, count: int = 8, first=None, active: int = 4):
+        self.graph = graph
+        self.active = active
+        self.reverse_graph = graph.reversed()
+        self.landmarks: list[int] = []
+        self.from_landmark: list[array] = []
+        self.to_landmark: list[array] = []
+        self._select(count, graph.ids[first] if first is not None else 0)
+
+    def _select(self, count: int, first: int) -> None:
+        """
+        Farthest-point selection: each new landmark is the reachable node
+        farthest from the landmarks chosen so far.
+        """
+        n = len(self.graph)
+        inf = float('inf')
+        # Start from the reachable node farthest from `first`, on the graph's rim
+        distances = shortest_distances(self.graph, first)
+        candidate = max((v for v in range(n) if distances[v] < inf), key=distances.__getitem__)
+        closest = array('d', [inf]) * n
+        while len(self.landmarks) < min(count, n):
+            landmark = candidate
+            self.landmarks.append(landmark)
+            self.from_landmark.append(shortest_distances(self.graph, landmark))
+            self.to_landmark.append(shortest_distances(self.reverse_graph, landmark))
+            best = -1.0
+            for v in range(n):
+                d = min(self.from_landmark[-1][v], self.to_landmark[-1][v])
+                if d < closest[v]:
+                    closest[v] = d
+                if inf > closest[v] > best:
+                    best, candidate = closest[v], v
+            if best <= 0:
+                break
+
+    def _terms(self, v: int, reverse: bool, other: int = None) -> list[tuple]:
+        """
+        (table, d, sign) triples whose bounds sign * (d - table[u]) hold for
+        d(u, v), or for d(v, u) if reverse is set. Given the other endpoint
+        of the query, only the self.active terms with the largest bound
+        there are kept, which is how ALT trims the per-node cost.
+        """
+        inf = float('inf')
+        sign = -1.0 if reverse else 1.0
+        # Landmarks v cannot reach, or be reached from, give no bound
+        terms = ([(from_l, from_l[v], sign) for from_l in self.from_landmark if from_l[v] < inf]
+                 + [(to_l, to_l[v], -sign) for to_l in self.to_landmark if to_l[v] < inf])
+        if other is not None:
+            terms.sort(key=lambda term: term[2] * (term[1] - term[0][other]), reverse=True)
+            del terms[self.active:]
+        return terms
+
+    def bound_to(self, target: int, source: int = None):
+        """Function giving a lower bound on d(v, target) for node ids v,
+        using the active landmarks for source if it is given."""
+        return _max_bound(self._terms(target, False, source))
+
+    def bound_from(self, source: int, target: int = None):
+        """Function giving a lower bound on d(source, v) for node ids v,
+        using the active landmarks for target if it is given."""
+        return _max_bound(self._terms(source, True, target))
+
+    def heuristic_fn(self, goal, start=None):
+        """heuristic_fn on states for searches towards goal, from start if given."""
+        ids = self.graph.ids
+        bound = self.bound_to(ids[goal], ids[start] if start is not None else None)
+        return lambda state: bound(ids[state])
+
+
+def _max_bound(terms: list[tuple]):
+    """max(0, sign * (d - table[v])) over terms, unrolled for up to four."""
+    if not terms:
+        return lambda v: 0.0
+    if len(terms) <= 4:
+        # repeating the first term leaves the max unchanged
+        (t1, d1, s1), (t2, d2, s2), (t3, d3, s3), (t4, d4, s4) = terms + terms[:1] * (4 - len(terms))
+        return lambda v: max(s1 * (d1 - t1[v]), s2 * (d2 - t2[v]), s3 * (d3 - t3[v]),
+                             s4 * (d4 - t4[v]), 0.0)
+
+    def bound(v: int) -> float:
+        h = 0.0
+        for table, d, sign in terms:
+            x = sign * (d - table[v])
+            if x > h:
+                h = x
+        return h
+    return bound
+
+
+def bidirectional_alt_search(landmarks: Landmarks, start, goal, stats: SearchStats = None):
+    """
+    Bidirectional A* with ALT heuristics. Both searches use the averaged
+    potential p(v) = (h_goal(v) - h_start(v)) / 2 (the reverse search
+    uses -p), which keeps both consistent, so the search can stop as soon
+    as the two smallest frontier keys add up to the best path found.
+    Returns the same list of Nodes as a_star_search.
+    """
+    graph, reverse_graph = landmarks.graph, landmarks.reverse_graph
+    source, target = graph.ids[start], graph.ids[goal]
+    n = len(graph)
+    inf = float('inf')
+    potential = array('d', [inf]) * n  # inf marks a potential not computed yet
+    to_goal, from_start = landmarks.bound_to(target, source), landmarks.bound_from(source, target)
+
+    def p(v):
+        if potential[v] == inf:
+            potential[v] = (to_goal(v) - from_start(v)) / 2
+        return potential[v]
+
+    g = [array('d', [inf]) * n, array('d', [inf]) * n]
+    parent = [array('q', [-1]) * n, array('q', [-1]) * n]
+    g[0][source] = 0.0
+    g[1][target] = 0.0
+    frontiers = [[(p(source), 0.0, source)], [(-p(target), 0.0, target)]]
+    sides = [(graph, 1.0), (reverse_graph, -1.0)]
+    best, meeting = inf, -1
+    if source == target:
+        best, meeting = 0.0, source
+
+    while frontiers[0] and frontiers[1]:
+        if frontiers[0][0][0] + frontiers[1][0][0] >= best:
+            break
+        side = 0 if frontiers[0][0][0] <= frontiers[1][0][0] else 1
+        key, g_u, u = heapq.heappop(frontiers[side])
+        if g_u > g[side][u]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        if stats is not None:
+            stats.nodes_expanded += 1
+        current, other, came_from = g[side], g[1 - side], parent[side]
+        frontier, (side_graph, sign) = frontiers[side], sides[side]
+        targets, weights = side_graph.targets, side_graph.weights
+        for e in range(side_graph.offsets[u], side_graph.offsets[u + 1]):
+            v = targets[e]
+            g_v = g_u + weights[e]
+            if g_v < current[v]:
+                current[v] = g_v
+                came_from[v] = u
+                p_v = potential[v]
+                if p_v == inf:
+                    p_v = potential[v] = (to_goal(v) - from_start(v)) / 2
+                heapq.heappush(frontier, (g_v + sign * p_v, g_v, v))
+                if stats is not None:
+                    stats.nodes_generated += 1
+                if g_v + other[v] < best:
+                    best, meeting = g_v + other[v], v
+
+    if meeting < 0:
+        return None
+    forward = [meeting]
+    while parent[0][forward[-1]] >= 0:
+        forward.append(parent[0][forward[-1]])
+    ids = forward[::-1]
+    while parent[1][ids[-1]] >= 0:
+        ids.append(parent[1][ids[-1]])
+
+    node = None
+    for i in ids:
+        if node is None:
+            cost = 0.0
+        else:
+            u = graph.ids[node.state]
+            cost = node.g + min(graph.weights[e] for e in range(graph.offsets[u], graph.offsets[u + 1])
+                                if graph.targets[e] == i)
+        node = Node(graph.states[i], node, g=cost, h=to_goal(i))
+    return node.path()
+
+
+if __name__ == '__main__':
+    # 20 x 20 rooms joined by one narrow door per wall, so straight-line
+    # estimates keep pointing into walls
+    random.seed(0)
+    size, room = 120, 20
+    blocked = set()
+    for wall in range(room, size, room):
+        for band in range(0, size, room):
+            door = band + random.randrange(1, room - 1)
+            blocked |= {(r, wall) for r in range(band, band + room) if r != door}
+            door = band + random.randrange(1, room - 1)
+            blocked |= {(wall, c) for c in range(band, band + room) if c != door}
+    graph = CSRGraph.from_grid(size, size, blocked)
+
+    started = perf_counter()
+    landmarks = Landmarks(graph, count=8)
+    print(f"{size} x {size} grid, 8 landmarks built in {perf_counter() - started:.2f}s")
+
+    queries = [tuple(random.sample(graph.states, 2)) for _ in range(30)]
+
+    def manhattan_to(goal):
+        return lambda state: abs(state[0] - goal[0]) + abs(state[1] - goal[1])
+
+    searches = (
+        ("A*, Manhattan", lambda s, t, stats: csr_a_star_search(graph, s, t, manhattan_to(t), stats)),
+        ("A*, ALT", lambda s, t, stats: csr_a_star_search(graph, s, t, landmarks.heuristic_fn(t, s), stats)),
+        ("Bidirectional A*, ALT", lambda s, t, stats: bidirectional_alt_search(landmarks, s, t, stats)),
+    )
+    for name, search in searches:
+        # best of three passes, so one slow pass on a busy machine does not decide
+        elapsed = float('inf')
+        for _ in range(3):
+            stats = SearchStats()
+            total = 0.0
+            started = perf_counter()
+            for s, t in queries:
+                total += search(s, t, stats)[-1].g
+            elapsed = min(elapsed, perf_counter() - started)
+        print(f"{name}: total cost {total:g}, {elapsed / len(queries) * 1000:.2f} ms/query, "
+              f"{stats.nodes_expanded // len(queries)} expanded/query")
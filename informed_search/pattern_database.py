@@ -0,0 +1,116 @@
+import os
+import tempfile
+from array import array
+from collections import deque
+import numpy as np
+from graph_search import a_star_search, LazyStateSpace, SearchStats
+from vacuum_world import VacuumWorld, cost_fn
+
+# Table entry for abstract states that cannot reach the goal
+UNREACHED = 0xFFFF
+
+
+class PatternDatabase:
+    """
+    Admissible heuristic read from a table of exact distances in an
+    abstraction of the problem. index_fn maps a concrete state to its
+    abstract state's slot in the table. Tables are uint16 NumPy arrays;
+    saved tables are memory-mapped on load, so only the pages a search
+    touches are read from disk.
+    """
+
+    def __init__(self, table: np.ndarray, index_fn):
+        self.table = table
+        self.index_fn = index_fn
+
+    @classmethod
+    def build(cls, size: int, goal_indices, predecessors_fn, index_fn):
+        """
+        Backward BFS over abstract states 0..size-1 from the abstract goal
+        states, with predecessors_fn(index) giving the abstract states one
+        unit-cost step before index.
+        """
+        distances = array('H', [UNREACHED]) * size
+        frontier = deque()
+        for index in goal_indices:
+            distances[index] = 0
+            frontier.append(index)
+        while frontier:
+            index = frontier.popleft()
+            distance = distances[index] + 1
+            for predecessor in predecessors_fn(index):
+                if distances[predecessor] == UNREACHED:
+                    distances[predecessor] = distance
+                    frontier.append(predecessor)
+        return cls(np.frombuffer(distances, dtype=np.uint16), index_fn)
+
+    def save(self, path: str) -> None:
+        np.save(path, self.table)
+
+    @classmethod
+    def load(cls, path: str, index_fn):
+        return cls(np.load(path, mmap_mode='r'), index_fn)
+
+    def __call__(self, state) -> float:
+        distance = int(self.table[self.index_fn(state)])
+        return float('inf') if distance == UNREACHED else distance
+
+    def batch(self, states: list) -> list:
+        """Look up many states with one fancy-indexing call."""
+        indices = np.fromiter(map(self.index_fn, states), dtype=np.int64, count=len(states))
+        distances = self.table[indices]
+        if (distances == UNREACHED).any():
+            return np.where(distances == UNREACHED, np.inf, distances).tolist()
+        return distances.tolist()
+
+
+def vacuum_pattern_database(world: VacuumWorld, pattern: list[int]) -> PatternDatabase:
+    """
+    Pattern database for a VacuumWorld that keeps the agent's location and
+    the dirt of the cells in pattern, ignoring every other cell. Its
+    distances count both the moves and the sucks needed for those cells.
+    """
+    k = len(pattern)
+    position = {cell: j for j, cell in enumerate(pattern)}
+
+    def index_fn(state):
+        dirt = world.dirt(state)
+        pattern_dirt = 0
+        for j, cell in enumerate(pattern):
+            if dirt >> cell & 1:
+                pattern_dirt |= 1 << j
+        return world.location(state) << k | pattern_dirt
+
+    def predecessors_fn(index):
+        location, pattern_dirt = index >> k, index & ((1 << k) - 1)
+        predecessors = [cell << k | pattern_dirt for cell in world.neighbours[location]]
+        # Undo sucking the current cell, if it is part of the pattern
+        if location in position and not pattern_dirt >> position[location] & 1:
+            predecessors.append(index | 1 << position[location])
+        return predecessors
+
+    goal = index_fn(world.goal_state())
+    return PatternDatabase.build(world.cells << k, [goal], predecessors_fn, index_fn)
+
+
+if __name__ == '__main__':
+    world = VacuumWorld(3, 4)
+    start, goal = world.initial_state(), world.goal_state()
+    half = world.cells // 2
+    patterns = [list(range(half)), list(range(half, world.cells))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        databases = []
+        for i, pattern in enumerate(patterns):
+            path = os.path.join(directory, f"vacuum_pdb_{i}.npy")
+            database = vacuum_pattern_database(world, pattern)
+            database.save(path)
+            databases.append(PatternDatabase.load(path, database.index_fn))
+
+        def pdb_heuristic(state):
+            return max(world.heuristic(state), *(database(state) for database in databases))
+
+        for name, heuristic in (("dirt count", world.heuristic), ("pattern databases", pdb_heuristic)):
+            stats = SearchStats()
+            path = a_star_search(start, goal, LazyStateSpace(world.successors), cost_fn, heuristic, stats)
+            print(f"A* with {name}: cost {path[-1].g}, {stats}")
@@ -1,4 +1,23 @@
-from graph_search import a_star_search
+from graph_search import a_star_search, LazyStateSpace
+
+
+def vacuum_successors(state):
+    loc, a_stat, b_stat = state
+    successors = []
+
+    # Suck current square
+    if loc == 'A' and a_stat == 'Dirty':
+        successors.append(('A', 'Clean', b_stat))
+    elif loc == 'B' and b_stat == 'Dirty':
+        successors.append(('B', a_stat, 'Clean'))
+
+    # Move
+    if loc == 'A':
+        successors.append(('B', a_stat, b_stat))
+    else:
+        successors.append(('A', a_stat, b_stat))
+
+    return successors
 
 
 def generate_vacuum_state_space():
@@ -10,21 +29,7 @@ def generate_vacuum_state_space():
         for a_stat in dirt_status:
             for b_stat in dirt_status:
                 state = (loc, a_stat, b_stat)
-                successors = []
-
-                # Suck current square
-                if loc == 'A' and a_stat == 'Dirty':
-                    successors.append(('A', 'Clean', b_stat))
-                elif loc == 'B' and b_stat == 'Dirty':
-                    successors.append(('B', a_stat, 'Clean'))
-
-                # Move
-                if loc == 'A':
-                    successors.append(('B', a_stat, b_stat))
-                else:
-                    successors.append(('A', a_stat, b_stat))
-
-                state_space[state] = successors
+                state_space[state] = vacuum_successors(state)
 
     return state_space
 
@@ -39,10 +44,45 @@ def heuristic_fn(state):
     return dirty_count  # estimate = # of remaining tasks
 
 
-def print_path(path):
+# Packed states: bit 0 is the location (set for B), bits 1 and 2 mark A and B dirty
+AT_B, A_DIRTY, B_DIRTY = 1, 2, 4
+
+
+def encode(state):
+    loc, a_stat, b_stat = state
+    return (AT_B if loc == 'B' else 0) \
+        | (A_DIRTY if a_stat == 'Dirty' else 0) \
+        | (B_DIRTY if b_stat == 'Dirty' else 0)
+
+
+def decode(packed):
+    return ('B' if packed & AT_B else 'A',
+            'Dirty' if packed & A_DIRTY else 'Clean',
+            'Dirty' if packed & B_DIRTY else 'Clean')
+
+
+def vacuum_successors_packed(state):
+    successors = []
+    # Suck current square
+    here = B_DIRTY if state & AT_B else A_DIRTY
+    if state & here:
+        successors.append(state & ~here)
+    # Move
+    successors.append(state ^ AT_B)
+    return successors
+
+
+def heuristic_fn_packed(state):
+    return (state & (A_DIRTY | B_DIRTY)).bit_count()
+
+
+def print_path(path, decode_fn=None):
     print("Solution path:")
     for node in path:
-        print(node)
+        if decode_fn is None:
+            print(node)
+        else:
+            print(f"State: {decode_fn(node.state)} - g: {node.g}, h: {node.h}, f: {node.f}")
     print(f"Total cost: {path[-1].g}")
     print(f"Explored nodes: {len(path)}")
 
@@ -55,3 +95,12 @@ if __name__ == '__main__':
     print("Vacuum Cleaner A* Search:")
     path = a_star_search(initial, goal, state_space, cost_fn, heuristic_fn)
     print_path(path)
+
+    print("\nVacuum Cleaner A* Search (lazy state space):")
+    path = a_star_search(initial, goal, LazyStateSpace(vacuum_successors), cost_fn, heuristic_fn)
+    print_path(path)
+
+    print("\nVacuum Cleaner A* Search (packed states):")
+    path = a_star_search(encode(initial), encode(goal), LazyStateSpace(vacuum_successors_packed),
+                         cost_fn, heuristic_fn_packed)
+    print_path(path, decode)
@@ -0,0 +1,126 @@
+import sys
+from time import perf_counter
+from graph_search import (a_star_search, breadth_first_search,
+                          greedy_best_first_search, LazyStateSpace, SearchStats)
+
+
+class VacuumWorld:
+    """
+    Vacuum world on a rows x cols grid; VacuumWorld(n) is the classic
+    N-location world in a single row. A state is one int: the agent's cell
+    index above one dirt bit per cell, so there are cells * 2^cells states,
+    and they are only generated as a search reaches them.
+    """
+
+    def __init__(self, rows: int, cols: int = None):
+        if cols is None:
+            rows, cols = 1, rows
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.dirt_mask = (1 << self.cells) - 1
+        self.neighbours = [self._neighbours(cell) for cell in range(self.cells)]
+
+    def _neighbours(self, cell: int) -> list[int]:
+        row, col = divmod(cell, self.cols)
+        result = []
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                result.append(r * self.cols + c)
+        return result
+
+    def state(self, location: int, dirt: int) -> int:
+        return (location << self.cells) | dirt
+
+    def location(self, state: int) -> int:
+        return state >> self.cells
+
+    def dirt(self, state: int) -> int:
+        return state & self.dirt_mask
+
+    def initial_state(self) -> int:
+        """Agent in cell 0, every cell dirty."""
+        return self.state(0, self.dirt_mask)
+
+    def goal_state(self) -> int:
+        """Agent back in cell 0, every cell clean."""
+        return self.state(0, 0)
+
+    def successors(self, state: int) -> list[int]:
+        location, dirt = self.location(state), self.dirt(state)
+        successors = []
+
+        # Suck current square
+        here = 1 << location
+        if dirt & here:
+            successors.append(self.state(location, dirt & ~here))
+
+        # Move
+        for cell in self.neighbours[location]:
+            successors.append(self.state(cell, dirt))
+
+        return successors
+
+    def heuristic(self, state: int) -> int:
+        return self.dirt(state).bit_count()  # estimate = # of remaining tasks
+
+    def decode(self, state: int) -> tuple:
+        dirt = self.dirt(state)
+        return (self.location(state),
+                *('Dirty' if dirt >> cell & 1 else 'Clean' for cell in range(self.cells)))
+
+    def __len__(self):
+        return self.cells * 2 ** self.cells
+
+
+def cost_fn(a, b):
+    return 1  # constant cost for all moves
+
+
+def benchmark(sizes=range(2, 21), time_budget: float = 10.0):
+    """
+    Time BFS, A* and greedy search on 1 x N vacuum worlds, reporting
+    solution length and nodes expanded.
+    An algorithm that takes longer than time_budget seconds for some N
+    is skipped for all larger N.
+    """
+    algorithms = {
+        "BFS": lambda world, space, stats: breadth_first_search(
+            world.initial_state(), world.goal_state(), space, stats),
+        "A*": lambda world, space, stats: a_star_search(
+            world.initial_state(), world.goal_state(), space, cost_fn, world.heuristic, stats),
+        "Greedy": lambda world, space, stats: greedy_best_first_search(
+            world.initial_state(), world.goal_state(), space, world.heuristic, stats),
+    }
+    too_slow = set()
+
+    print(f"{'N':>3} {'States':>10} " + " ".join(f"{name:>32}" for name in algorithms))
+    for n in sizes:
+        world = VacuumWorld(n)
+        results = []
+        for name, search in algorithms.items():
+            if name in too_slow:
+                results.append("skipped")
+                continue
+            space = LazyStateSpace(world.successors)
+            stats = SearchStats()
+            start = perf_counter()
+            path = search(world, space, stats)
+            elapsed = perf_counter() - start
+            if elapsed > time_budget:
+                too_slow.add(name)
+            results.append(f"{elapsed:.4f}s ({len(path) - 1} steps, {stats.nodes_expanded} exp)")
+        print(f"{n:>3} {len(world):>10} " + " ".join(f"{result:>32}" for result in results))
+
+
+if __name__ == '__main__':
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print("N-location Vacuum World Benchmark:")
+    benchmark(range(2, max_n + 1))
+
+    print("\nA* on a 3 x 3 grid:")
+    world = VacuumWorld(3, 3)
+    path = a_star_search(world.initial_state(), world.goal_state(),
+                         LazyStateSpace(world.successors), cost_fn, world.heuristic)
+    for node in path:
+        print(f"State: {world.decode(node.state)} - g: {node.g}, h: {node.h}, f: {node.f}")
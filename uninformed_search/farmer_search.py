@@ -1,5 +1,5 @@
 from itertools import product
-from search import Searcher, StateSpace
+from search import Searcher, StateSpace, LazyStateSpace, StateCodec
 
 sides = ['W', 'E']
 
@@ -43,6 +43,46 @@ def generate_successors(state):
     return options
 
 
+# Packed states: one bit per item, set when it is on the east side
+FARMER, WOLF, GOAT, CABBAGE = 8, 4, 2, 1
+items = (FARMER, WOLF, GOAT, CABBAGE)
+
+
+def encode(state):
+    packed = 0
+    for item, side in zip(items, state):
+        if side == 'E':
+            packed |= item
+    return packed
+
+
+def decode(packed):
+    return tuple('E' if packed & item else 'W' for item in items)
+
+
+def is_valid_packed(state):
+    goat_side = bool(state & GOAT)
+    if bool(state & FARMER) != goat_side and \
+            (bool(state & WOLF) == goat_side or bool(state & CABBAGE) == goat_side):
+        return False
+    return True
+
+
+def generate_successors_packed(state):
+    farmer_side = bool(state & FARMER)
+    options = []
+    # Farmer alone, then with wolf, goat or cabbage if on the same side
+    for passenger in (0, WOLF, GOAT, CABBAGE):
+        if passenger and bool(state & passenger) != farmer_side:
+            continue
+        new_state = state ^ FARMER ^ passenger
+        if is_valid_packed(new_state):
+            options.append(new_state)
+    return options
+
+
+codec = StateCodec(encode, decode)
+
 # Construct state space graph
 
 all_states = list(product(sides, repeat=4))
@@ -58,4 +98,16 @@ goal = ('E', 'E', 'E', 'E')
 if __name__ == '__main__':
     print("Farmer River Crossing Problem:")
     searcher = Searcher(initial, goal, StateSpace(state_space))
-    searcher.run(insert_as_first=False)
+    searcher.run(insert_as_first=False, graph_search=True)
+
+    print("\nFarmer River Crossing Problem (lazy state space):")
+    # Every crossing can be undone, so successors double as predecessors
+    lazy_space = LazyStateSpace(generate_successors, predecessor_fn=generate_successors)
+    searcher = Searcher(initial, goal, lazy_space)
+    searcher.run(insert_as_first=False, graph_search=True)
+    print(f"Cache: {lazy_space.cache_info()}")
+
+    print("\nFarmer River Crossing Problem (packed states):")
+    searcher = Searcher(encode(initial), encode(goal), LazyStateSpace(generate_successors_packed))
+    for node in codec.decode_path(searcher.graph_search(insert_as_first=False)):
+        node.display()
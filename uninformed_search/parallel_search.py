@@ -0,0 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+from search import LazyStateSpace, Node, NodeStore, StateSpace
+
+# Successor function of the current worker process, set once by _init_worker
+_successor_fn = None
+
+
+def _init_worker(successor_fn: Callable[[Any], list]) -> None:
+    global _successor_fn
+    _successor_fn = successor_fn
+
+
+def _expand_chunk(states: list) -> list[list]:
+    return [_successor_fn(state) for state in states]
+
+
+def successor_function(state_space: StateSpace) -> Callable[[Any], list]:
+    """A picklable successor function for state_space, for use in worker processes."""
+    if isinstance(state_space, LazyStateSpace):
+        # Workers keep no shared cache, so send the undecorated function
+        return state_space.successor_fn.__wrapped__
+    return state_space.state_space.__getitem__
+
+
+def parallel_breadth_first_search(initial_state, goal_state, state_space: StateSpace,
+                                  max_workers: int = None, chunk_size: int = 512) -> list[Node]:
+    """
+    Level-synchronous BFS. Each layer of the frontier is split into chunks
+    whose successors are generated in a process pool; the parent process
+    then merges the results in layer order, so every state keeps the same
+    parent as in serial BFS and the same shortest path is returned.
+    Layers smaller than chunk_size are expanded in-process.
+    """
+    store = NodeStore()
+    root = store.add(initial_state)
+    if initial_state == goal_state:
+        return store.path(root)
+    reached = {initial_state}
+    layer = [root]
+    successor_fn = successor_function(state_space)
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                             initargs=(successor_fn,)) as executor:
+        while layer:
+            states = [store.states[index] for index in layer]
+            if len(states) < chunk_size:
+                expanded = [successor_fn(state) for state in states]
+            else:
+                chunks = [states[i:i + chunk_size] for i in range(0, len(states), chunk_size)]
+                expanded = [children for chunk in executor.map(_expand_chunk, chunks)
+                            for children in chunk]
+
+            next_layer = []
+            for parent, children in zip(layer, expanded):
+                # Same child order as Node.expand feeding a FIFO fringe
+                for child in reversed(children):
+                    if child in reached:
+                        continue
+                    reached.add(child)
+                    index = store.add(child, parent)
+                    if child == goal_state:
+                        return store.path(index)
+                    next_layer.append(index)
+            layer = next_layer
+
+
+if __name__ == '__main__':
+    from farmer_search import generate_successors, initial, goal
+
+    print("Farmer River Crossing Problem (parallel BFS):")
+    path = parallel_breadth_first_search(initial, goal, LazyStateSpace(generate_successors),
+                                         chunk_size=1)
+    print("Solution path:")
+    for node in path:
+        node.display()
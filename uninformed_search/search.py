@@ -1,17 +1,68 @@
-from typing import Self, Any
+import heapq
+from array import array
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from itertools import count
+from time import perf_counter
+from typing import Self, Any, Callable, Iterable
+
+
+# Returned by depth-limited search when the depth limit stopped the search
+CUTOFF = "cutoff"
 
 
 class StateSpace:
     def __init__(self, state_space: dict = None):
         self.state_space = state_space
+        self.reverse_state_space = None
 
     def successor(self, state: Any):
         if self.state_space is None:
             print("No state space set")
         return self.state_space[state]
 
+    def predecessor(self, state: Any):
+        """States with an edge into state. The reverse index is built once."""
+        if self.reverse_state_space is None:
+            reverse = {}
+            for parent, children in self.state_space.items():
+                for child in children:
+                    reverse.setdefault(child, []).append(parent)
+            self.reverse_state_space = reverse
+        return self.reverse_state_space.get(state, [])
+
+
+class LazyStateSpace(StateSpace):
+    """
+    State space backed by a successor function instead of a dict, so only
+    states the search actually touches are generated. Successor lists of
+    the max_cached most recently used states are memoized.
+    """
+
+    def __init__(self, successor_fn: Callable[[Any], list], max_cached: int = 4096,
+                 predecessor_fn: Callable[[Any], list] = None):
+        super().__init__()
+        self.successor_fn = lru_cache(maxsize=max_cached)(successor_fn)
+        self.predecessor_fn = None
+        if predecessor_fn is not None:
+            self.predecessor_fn = lru_cache(maxsize=max_cached)(predecessor_fn)
+
+    def successor(self, state: Any):
+        return self.successor_fn(state)
+
+    def predecessor(self, state: Any):
+        if self.predecessor_fn is None:
+            raise ValueError("LazyStateSpace needs a predecessor_fn for backward search")
+        return self.predecessor_fn(state)
+
+    def cache_info(self):
+        return self.successor_fn.cache_info()
+
 
 class Node:
+    __slots__ = ("state", "parent_node", "depth")
+
     def __init__(self, state: Any, parent: Self = None, depth: int = 0):
         self.state = state
         self.parent_node = parent
@@ -27,12 +78,10 @@ class Node:
         return path
 
     def expand(self, state_space: StateSpace):
-        successors: list[Node] = []
+        # Children are returned last-to-first, matching the order the
+        # original insert-as-first construction produced.
         children = state_space.successor(self.state)
-        for child in children:
-            s = Node(child, self, self.depth + 1)
-            successors = insert(s, successors)
-        return successors
+        return [Node(child, self, self.depth + 1) for child in reversed(children)]
 
     def display(self) -> None:
         print(self)
@@ -41,59 +90,474 @@ class Node:
         return f"State: {self.state} - Depth: {self.depth}"
 
 
-def insert(node: Node, queue: list[Node], insert_as_first: bool = True) -> list[Node]:
+class NodeStore:
     """
-    Returns a copy of the queue with the node inserted.
-    Use insert_as_first=True for DFS, False for BFS.
+    Struct-of-arrays storage for a search tree. Node i is states[i], with
+    its parent index and depth packed into arrays (the root's parent is -1),
+    which is far smaller than one Node object per generated state.
     """
-    if insert_as_first:
-        return [node] + queue
-    else:
-        return queue + [node]
 
+    def __init__(self):
+        self.states: list[Any] = []
+        self.parents = array('q')
+        self.depths = array('L')
+
+    def add(self, state: Any, parent: int = -1) -> int:
+        """Store a node and return its index."""
+        self.states.append(state)
+        self.parents.append(parent)
+        self.depths.append(0 if parent < 0 else self.depths[parent] + 1)
+        return len(self.states) - 1
+
+    def path(self, index: int) -> list[Node]:
+        """Rebuild the Node chain ending at index, in Node.path() order."""
+        indices = []
+        while index >= 0:
+            indices.append(index)
+            index = self.parents[index]
+        node = None
+        for i in reversed(indices):
+            node = Node(self.states[i], node, self.depths[i])
+        return node.path()
+
+    def __len__(self):
+        return len(self.states)
+
+
+class StateCodec:
+    """
+    Packs puzzle states into ints and back. Searching the encoded space
+    hashes and compares small ints instead of tuples of strings;
+    decode_path turns a solution back into readable states.
+    """
+
+    def __init__(self, encode: Callable[[Any], int], decode: Callable[[int], Any]):
+        self.encode = encode
+        self.decode = decode
+
+    def encode_space(self, state_space: dict) -> dict:
+        return {self.encode(state): [self.encode(child) for child in children]
+                for state, children in state_space.items()}
+
+    def decode_path(self, path: list[Node]) -> list[Node]:
+        node = None
+        for packed in reversed(path):
+            node = Node(self.decode(packed.state), node, packed.depth)
+        return node.path()
+
+
+class Frontier:
+    """Base class for the fringe of nodes waiting to be expanded."""
+
+    def __init__(self):
+        self.elements = []
 
-def insert_all(nodes_to_add: list[Node], queue: list[Node], insert_as_first: bool = True) -> list[Node]:
+    def insert(self, node: Node) -> None:
+        raise NotImplementedError
+
+    def insert_all(self, nodes: list[Node]) -> None:
+        for node in nodes:
+            self.insert(node)
+
+    def remove_first(self) -> Node:
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __bool__(self):
+        return bool(self.elements)
+
+    def __repr__(self):
+        return repr(list(self.elements))
+
+
+class StackFrontier(Frontier):
+    """LIFO fringe for DFS, equivalent to inserting every node first."""
+
+    def insert(self, node: Node) -> None:
+        self.elements.append(node)
+
+    def remove_first(self) -> Node:
+        return self.elements.pop()
+
+    def __repr__(self):
+        return repr(self.elements[::-1])
+
+
+class QueueFrontier(Frontier):
+    """FIFO fringe for BFS, equivalent to inserting every node last."""
+
+    def __init__(self):
+        self.elements = deque()
+
+    def insert(self, node: Node) -> None:
+        self.elements.append(node)
+
+    def remove_first(self) -> Node:
+        return self.elements.popleft()
+
+
+class PriorityFrontier(Frontier):
     """
-    Inserts all nodes into the queue using insert().
-    Returns a new list with the combined elements.
+    Fringe ordered by priority_fn(node), lowest first.
+    Ties are broken by insertion order. Defaults to node depth.
     """
-    for node in nodes_to_add:
-        queue = insert(node, queue, insert_as_first)
-    return queue
 
+    def __init__(self, priority_fn: Callable[[Node], Any] = None):
+        super().__init__()
+        self.priority_fn = priority_fn or (lambda node: node.depth)
+        self.counter = count()
+
+    def insert(self, node: Node) -> None:
+        heapq.heappush(self.elements,
+                       (self.priority_fn(node), next(self.counter), node))
 
-def remove_first(queue: list[Node]) -> Node:
-    """Removes and returns the first element from the queue."""
-    return queue.pop(0)
+    def remove_first(self) -> Node:
+        return heapq.heappop(self.elements)[-1]
+
+    def __repr__(self):
+        return repr([entry[-1] for entry in sorted(self.elements)])
+
+
+class SearchStats:
+    """
+    Counters and timers collected while a Searcher runs.
+    Pass sink=print to trace the fringe after every expansion.
+    """
+
+    def __init__(self, sink: Callable[[str], None] = None):
+        self.sink = sink
+        self.reset()
+
+    def reset(self) -> None:
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.max_fringe_size = 0
+        self.phase_times: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Accumulate the wall time spent inside the block under name."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+
+    def generated(self, n: int = 1) -> None:
+        self.nodes_generated += n
+
+    def expanded(self, children: list[Node]) -> None:
+        self.nodes_expanded += 1
+        self.nodes_generated += len(children)
+
+    def observe(self, fringe: Frontier) -> None:
+        self.max_fringe_size = max(self.max_fringe_size, len(fringe))
+        if self.sink is not None:
+            self.sink(f"Fringe: {fringe}")
+
+    def __repr__(self):
+        times = ", ".join(f"{name}: {seconds:.6f}s"
+                          for name, seconds in self.phase_times.items())
+        return (f"Generated: {self.nodes_generated} - Expanded: {self.nodes_expanded}"
+                f" - Max fringe: {self.max_fringe_size} - Times: {{{times}}}")
 
 
 class Searcher:
-    def __init__(self, initial_state, goal_state, state_space: StateSpace = None):
+    def __init__(self, initial_state, goal_state, state_space: StateSpace = None,
+                 stats: SearchStats = None):
         self.initial_state = initial_state
         self.goal_state = goal_state
         self.state_space = state_space
+        self.stats = stats
+
+    def _phase(self, name: str):
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.phase(name)
+
+    def _expand(self, node: Node) -> list[Node]:
+        if self.stats is None:
+            return node.expand(self.state_space)
+        with self.stats.phase("expand"):
+            children = node.expand(self.state_space)
+        self.stats.expanded(children)
+        return children
 
-    def tree_search(self, insert_as_first: bool = True) -> list[Node]:
+    def tree_search(self, insert_as_first: bool = True, fringe: Frontier = None) -> list[Node]:
         """
         Search the tree for the goal state and return the path from
         initial state to goal state using either DFS or BFS.
+        A custom fringe (e.g. a PriorityFrontier) overrides insert_as_first.
         """
-        fringe: list[Node] = []
+        if fringe is None:
+            fringe = StackFrontier() if insert_as_first else QueueFrontier()
+        stats = self.stats
         initial_node = Node(self.initial_state)
-        fringe = insert(initial_node, fringe, insert_as_first)
-        while fringe:
-            node = remove_first(fringe)
-            if node.state == self.goal_state:
-                return node.path()
-            children = node.expand(self.state_space)
-            fringe = insert_all(children, fringe, insert_as_first)
-            print(f"Fringe: {fringe}")
+        fringe.insert(initial_node)
+        if stats is not None:
+            stats.generated()
+        with self._phase("search"):
+            while fringe:
+                node = fringe.remove_first()
+                if node.state == self.goal_state:
+                    return node.path()
+                fringe.insert_all(self._expand(node))
+                if stats is not None:
+                    stats.observe(fringe)
+
+    def graph_search(self, insert_as_first: bool = True, fringe: Frontier = None) -> list[Node]:
+        """
+        Like tree_search, but remembers explored states and the states
+        currently on the fringe, so each state is expanded at most once.
+        Terminates on cyclic state spaces.
+        """
+        if fringe is None:
+            fringe = StackFrontier() if insert_as_first else QueueFrontier()
+        stats = self.stats
+        initial_node = Node(self.initial_state)
+        fringe.insert(initial_node)
+        if stats is not None:
+            stats.generated()
+        explored = set()
+        on_fringe = {self.initial_state}
+        with self._phase("search"):
+            while fringe:
+                node = fringe.remove_first()
+                on_fringe.discard(node.state)
+                if node.state == self.goal_state:
+                    return node.path()
+                explored.add(node.state)
+                for child in self._expand(node):
+                    if child.state not in explored and child.state not in on_fringe:
+                        on_fringe.add(child.state)
+                        fringe.insert(child)
+                if stats is not None:
+                    stats.observe(fringe)
+
+    def compact_search(self, insert_as_first: bool = True) -> list[Node]:
+        """
+        graph_search that keeps the search tree in a NodeStore and puts
+        node indices on the fringe. Node objects are only created for the
+        returned path.
+        """
+        stats = self.stats
+        store = NodeStore()
+        fringe = StackFrontier() if insert_as_first else QueueFrontier()
+        fringe.insert(store.add(self.initial_state))
+        if stats is not None:
+            stats.generated()
+        explored = set()
+        on_fringe = {self.initial_state}
+        with self._phase("search"):
+            while fringe:
+                index = fringe.remove_first()
+                state = store.states[index]
+                on_fringe.discard(state)
+                if state == self.goal_state:
+                    return store.path(index)
+                explored.add(state)
+                children = self.state_space.successor(state)
+                if stats is not None:
+                    stats.nodes_expanded += 1
+                    stats.generated(len(children))
+                for child in reversed(children):
+                    if child not in explored and child not in on_fringe:
+                        on_fringe.add(child)
+                        fringe.insert(store.add(child, index))
+                if stats is not None:
+                    stats.observe(fringe)
+
+    def depth_limited_search(self, limit: int, transpositions: bool = True):
+        """
+        DFS that never expands nodes at depth limit or deeper.
+        Returns the solution path, CUTOFF if the limit stopped the search,
+        or None if no solution is reachable at all.
+        With transpositions=True a state already expanded at the same or a
+        shallower depth during this search is skipped.
+        """
+        stats = self.stats
+        fringe = StackFrontier()
+        fringe.insert(Node(self.initial_state))
+        if stats is not None:
+            stats.generated()
+        shallowest: dict[Any, int] = {}
+        cutoff = False
+        with self._phase("search"):
+            while fringe:
+                node = fringe.remove_first()
+                if node.state == self.goal_state:
+                    return node.path()
+                if transpositions:
+                    if shallowest.get(node.state, limit + 1) <= node.depth:
+                        continue
+                    shallowest[node.state] = node.depth
+                if node.depth >= limit:
+                    cutoff = True
+                    continue
+                fringe.insert_all(self._expand(node))
+                if stats is not None:
+                    stats.observe(fringe)
+        return CUTOFF if cutoff else None
+
+    def iterative_deepening_search(self, max_depth: int = None, transpositions: bool = True):
+        """
+        Run depth_limited_search with limits 0, 1, 2, ... until it stops
+        reporting CUTOFF. Finds the shallowest solution like BFS while only
+        keeping the current branch on the fringe.
+        Returns CUTOFF if max_depth is reached without an answer.
+        """
+        limit = 0
+        while max_depth is None or limit <= max_depth:
+            result = self.depth_limited_search(limit, transpositions)
+            if result is not CUTOFF:
+                return result
+            limit += 1
+        return CUTOFF
 
-    def run(self, insert_as_first: bool = True):
-        path = self.tree_search(insert_as_first)
+    def bidirectional_search(self) -> list[Node]:
+        """
+        BFS from the initial state and backwards from the goal state at the
+        same time, always expanding a whole layer of the smaller frontier.
+        Returns a shortest path in the same format as tree_search.
+        """
+        stats = self.stats
+        start, goal = self.initial_state, self.goal_state
+        if start == goal:
+            return Node(start).path()
+        forward = {start: Node(start)}
+        backward = {goal: Node(goal)}
+        forward_layer = [forward[start]]
+        backward_layer = [backward[goal]]
+        if stats is not None:
+            stats.generated(2)
+        with self._phase("search"):
+            while forward_layer and backward_layer:
+                if len(forward_layer) <= len(backward_layer):
+                    meeting, forward_layer = self._expand_layer(
+                        forward_layer, forward, backward, self.state_space.successor)
+                else:
+                    meeting, backward_layer = self._expand_layer(
+                        backward_layer, backward, forward, self.state_space.predecessor)
+                if meeting is not None:
+                    return self._join(forward[meeting], backward[meeting])
+
+    def _expand_layer(self, layer, reached, other_reached, neighbours):
+        """
+        Expand every node of one BFS layer. Returns the meeting state with
+        the shortest total path (or None) and the next layer.
+        """
+        stats = self.stats
+        meeting, best = None, None
+        next_layer = []
+        for node in layer:
+            children = neighbours(node.state)
+            if stats is not None:
+                stats.nodes_expanded += 1
+                stats.generated(len(children))
+            for state in children:
+                if state in reached:
+                    continue
+                child = Node(state, node, node.depth + 1)
+                reached[state] = child
+                next_layer.append(child)
+                if state in other_reached:
+                    total = child.depth + other_reached[state].depth
+                    if best is None or total < best:
+                        meeting, best = state, total
+        if stats is not None:
+            stats.max_fringe_size = max(stats.max_fringe_size, len(next_layer))
+        return meeting, next_layer
+
+    @staticmethod
+    def _join(forward_node: Node, backward_node: Node) -> list[Node]:
+        """Continue the forward branch along the backward branch to the goal."""
+        node = forward_node
+        backward_node = backward_node.parent_node
+        while backward_node is not None:
+            node = Node(backward_node.state, node, node.depth + 1)
+            backward_node = backward_node.parent_node
+        return node.path()
+
+    def run(self, insert_as_first: bool = True, fringe: Frontier = None, graph_search: bool = False):
+        if self.stats is not None:
+            self.stats.reset()
+        if graph_search:
+            path = self.graph_search(insert_as_first, fringe)
+        else:
+            path = self.tree_search(insert_as_first, fringe)
+        if path is None:
+            print("No solution found")
+            return
         print("Solution path:")
         for node in path:
             node.display()
+        if self.stats is not None:
+            print(f"Stats: {self.stats}")
+
+
+class BatchSearcher:
+    """
+    Answers many (start, goal) path queries over one StateSpace.
+    Each start state gets a single BFS tree, stored in a NodeStore and
+    shared by every query from that start; returned paths are cached
+    by (start, goal).
+    """
+
+    def __init__(self, state_space: StateSpace):
+        self.state_space = state_space
+        self.trees: dict[Any, tuple[NodeStore, dict[Any, int]]] = {}
+        self.cache: dict[tuple[Any, Any], list[Node] | None] = {}
+
+    def tree(self, start) -> tuple[NodeStore, dict[Any, int]]:
+        """BFS tree of everything reachable from start, with a state -> index map."""
+        if start in self.trees:
+            return self.trees[start]
+        store = NodeStore()
+        index_of = {start: store.add(start)}
+        fringe = deque([index_of[start]])
+        while fringe:
+            index = fringe.popleft()
+            for child in self.state_space.successor(store.states[index]):
+                if child not in index_of:
+                    index_of[child] = store.add(child, index)
+                    fringe.append(index_of[child])
+        self.trees[start] = store, index_of
+        return store, index_of
+
+    def path(self, start, goal) -> list[Node] | None:
+        """Shortest path from start to goal, or None if goal is unreachable."""
+        key = (start, goal)
+        if key not in self.cache:
+            store, index_of = self.tree(start)
+            index = index_of.get(goal)
+            self.cache[key] = None if index is None else store.path(index)
+        return self.cache[key]
+
+    def paths(self, start, goals) -> dict[Any, list[Node] | None]:
+        return {goal: self.path(start, goal) for goal in goals}
+
+    def batch(self, queries) -> list[list[Node] | None]:
+        """Answer (start, goal) pairs in order, building each start's tree once."""
+        return [self.path(start, goal) for start, goal in queries]
+
+    def reachable(self, start, goal) -> bool:
+        return goal in self.tree(start)[1]
+
+    def precompute_all_pairs(self, states: Iterable = None) -> None:
+        """
+        Build the BFS tree of every state; only sensible for small spaces.
+        A LazyStateSpace cannot list its states, so pass them as states.
+        """
+        if states is None:
+            if self.state_space.state_space is None:
+                raise ValueError("precompute_all_pairs needs explicit states for a state space "
+                                 "without a state_space dict, such as LazyStateSpace")
+            states = self.state_space.state_space
+        for state in states:
+            self.tree(state)
 
 
 if __name__ == '__main__':
@@ -110,10 +574,28 @@ if __name__ == '__main__':
         'J': [],
     }
 
-    searcher = Searcher('A', 'J', state_space=StateSpace(input_state_space))
+    searcher = Searcher('A', 'J', state_space=StateSpace(input_state_space),
+                        stats=SearchStats(sink=print))
 
     print("Depth-First Search:")
     searcher.run(insert_as_first=True)
 
     print("\nBreadth-First Search:")
     searcher.run(insert_as_first=False)
+
+    print("\nIterative Deepening Search:")
+    searcher.stats.reset()
+    for node in searcher.iterative_deepening_search():
+        node.display()
+    print(f"Stats: {searcher.stats}")
+
+    print("\nBidirectional Search:")
+    searcher.stats.reset()
+    for node in searcher.bidirectional_search():
+        node.display()
+    print(f"Stats: {searcher.stats}")
+
+    print("\nBatch queries from A:")
+    batch = BatchSearcher(StateSpace(input_state_space))
+    for goal, path in batch.paths('A', ['E', 'J', 'Z']).items():
+        print(f"{goal}: {path}")
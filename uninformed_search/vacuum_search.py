@@ -1,4 +1,4 @@
-from search import Searcher, StateSpace
+from search import Searcher, StateSpace, StateCodec
 
 # Full state space for 2-location vacuum cleaner problem
 vacuum_state_space = {
@@ -34,6 +34,25 @@ vacuum_state_space = {
     ],
 }
 
+# Packed states: bit 0 is the location (set for B), bits 1 and 2 mark A and B dirty
+AT_B, A_DIRTY, B_DIRTY = 1, 2, 4
+
+
+def encode(state):
+    loc, a_stat, b_stat = state
+    return (AT_B if loc == 'B' else 0) \
+        | (A_DIRTY if a_stat == 'Dirty' else 0) \
+        | (B_DIRTY if b_stat == 'Dirty' else 0)
+
+
+def decode(packed):
+    return ('B' if packed & AT_B else 'A',
+            'Dirty' if packed & A_DIRTY else 'Clean',
+            'Dirty' if packed & B_DIRTY else 'Clean')
+
+
+codec = StateCodec(encode, decode)
+
 initial_state = ('A', 'Dirty', 'Dirty')
 goal_state = ('A', 'Clean', 'Clean')
 
@@ -41,4 +60,10 @@ if __name__ == '__main__':
     print("Vacuum World BFS:")
     searcher = Searcher(initial_state, goal_state,
                         StateSpace(vacuum_state_space))
-    searcher.run(insert_as_first=False)
+    searcher.run(insert_as_first=False, graph_search=True)
+
+    print("\nVacuum World BFS (packed states):")
+    searcher = Searcher(encode(initial_state), encode(goal_state),
+                        StateSpace(codec.encode_space(vacuum_state_space)))
+    for node in codec.decode_path(searcher.graph_search(insert_as_first=False)):
+        node.display()